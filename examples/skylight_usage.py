@@ -6,6 +6,7 @@ This script demonstrates how to use the SkylightClient for basic operations.
 Make sure your .env file is configured before running this.
 """
 
+import re
 import sys
 from pathlib import Path
 
@@ -14,6 +15,9 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from skylight_client import SkylightClient
 
+# KEY=value lines; blank lines, comments and lines without '=' don't match
+ENV_LINE = re.compile(r'^[^\S\n]*([^#=\s][^=\n]*)=(.*?)[^\S\n]*$', re.MULTILINE)
+
 
 def load_env_vars():
     """Load environment variables from .env file"""
@@ -23,15 +27,7 @@ def load_env_vars():
         print("❌ .env file not found. Please create it with your Skylight credentials.")
         sys.exit(1)
 
-    env_vars = {}
-    with open(env_file, "r") as f:
-        for line in f:
-            line = line.strip()
-            if line and not line.startswith("#") and "=" in line:
-                key, value = line.split("=", 1)
-                env_vars[key] = value
-
-    return env_vars
+    return dict(ENV_LINE.findall(env_file.read_text()))
 
 
 def main():
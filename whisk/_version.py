@@ -1,39 +1,48 @@
 """Version information for whisk package."""
 
+import functools
+import re
 import subprocess
 import sys
 from pathlib import Path
 
+# Repository root (holds .git and pyproject.toml in a source checkout)
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# version = "x.y.z" line in pyproject.toml
+VERSION_PATTERN = re.compile(rb'version\s*=\s*"([^"]+)"')
+
+
+@functools.lru_cache(maxsize=1)
 def get_version():
-    """Get version from git tag or fallback to default."""
+    """Get version from git tag or pyproject, else a default (computed once)."""
     try:
         # Try to get version from git tag
         result = subprocess.run(
             ["git", "describe", "--tags", "--exact-match"],
             capture_output=True,
             text=True,
-            cwd=Path(__file__).parent.parent,
+            cwd=PROJECT_ROOT,
         )
         if result.returncode == 0:
             # Remove 'v' prefix if present
             version = result.stdout.strip()
-            return version[1:] if version.startswith('v') else version
+            return version[1:] if version.startswith("v") else version
     except (subprocess.SubprocessError, FileNotFoundError):
         pass
 
     # Fallback to reading from pyproject.toml
-    pyproject_path = Path(__file__).parent.parent / "pyproject.toml"
+    pyproject_path = PROJECT_ROOT / "pyproject.toml"
     if pyproject_path.exists():
-        import re
-        content = pyproject_path.read_text()
-        match = re.search(r'version\s*=\s*"([^"]+)"', content)
+        match = VERSION_PATTERN.search(pyproject_path.read_bytes())
         if match:
-            return match.group(1)
+            return match.group(1).decode()
 
     # Final fallback
     return "0.0.1"
 
+
 __version__ = get_version()
 
 if __name__ == "__main__":
-    print(__version__)
\ No newline at end of file
+    print(__version__)
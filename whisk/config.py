@@ -7,6 +7,7 @@ a single file in the user's config directory.
 """
 
 import base64
+import functools
 import os
 import yaml
 from pathlib import Path
@@ -17,6 +18,24 @@ import platformdirs
 
 logger = logging.getLogger(__name__)
 
+
+@functools.lru_cache(maxsize=8)
+def _load_yaml_cached(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """
+    Parse a YAML file, memoized on its path, modification time and size
+
+    Args:
+        path: YAML file path
+        mtime_ns: File modification time, part of the cache key only
+        size: File size in bytes, part of the cache key only
+
+    Returns:
+        Parsed YAML mapping (callers must not mutate it)
+    """
+    with open(path, 'r') as f:
+        return yaml.safe_load(f) or {}
+
+
 @dataclass
 class ListPairConfig:
     """Configuration for a single Paprika ↔ Skylight list pair"""
@@ -32,6 +51,9 @@ class WhiskConfig:
 
     # Sync behavior
     sync_interval_seconds: int = 60
+    # Score fuzzy name matches with rapidfuzz (the 'fast' extra) instead of
+    # difflib; faster, but borderline names can link differently
+    use_rapidfuzz: bool = False
 
     # Meal sync options
     meal_sync_enabled: bool = True
@@ -106,15 +128,17 @@ class ConfigManager:
             FileNotFoundError: If configuration file is missing
             ValueError: If configuration is invalid
         """
-        if not self.config_file.exists():
+        # A single stat both checks existence and keys the YAML cache
+        try:
+            stat = self.config_file.stat()
+        except FileNotFoundError:
             raise FileNotFoundError(
                 f"Configuration file not found: {self.config_file}\n"
                 f"Run 'whisk setup' to create initial configuration."
             )
 
         try:
-            with open(self.config_file, 'r') as f:
-                yaml_data = yaml.safe_load(f) or {}
+            yaml_data = _load_yaml_cached(str(self.config_file), stat.st_mtime_ns, stat.st_size)
         except yaml.YAMLError as e:
             raise ValueError(f"Invalid YAML in {self.config_file}: {e}")
 
@@ -135,6 +159,7 @@ class ConfigManager:
         # Create config object first to check meal sync setting
         config = WhiskConfig(
             sync_interval_seconds=yaml_data.get('sync_interval_seconds', 60),
+            use_rapidfuzz=yaml_data.get('use_rapidfuzz', False),
             list_pairs=list_pairs,
             # Meal sync options
             meal_sync_enabled=yaml_data.get('meal_sync_enabled', True),
@@ -171,6 +196,7 @@ class ConfigManager:
         # Prepare YAML data
         yaml_data = {
             'sync_interval_seconds': config.sync_interval_seconds,
+            'use_rapidfuzz': config.use_rapidfuzz,
             'credentials': encoded_credentials,
             # Meal sync options
             'meal_sync_enabled': config.meal_sync_enabled,
@@ -290,6 +316,11 @@ class ConfigManager:
 # Sync behavior
 sync_interval_seconds: 60
 
+# Use rapidfuzz for fuzzy item matching (requires: pip install 'whisk[fast]').
+# Faster on large lists, but borderline names may link differently than with
+# the default difflib matcher.
+use_rapidfuzz: false
+
 # Encoded credentials (generated by setup wizard)
 credentials:
   paprika_email: "<base64-encoded>"
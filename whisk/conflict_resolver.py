@@ -1,6 +1,7 @@
 """Conflict resolution system for Paprika ↔ Skylight sync using newest wins strategy"""
 
 import logging
+from itertools import islice
 from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime, timezone
 from dataclasses import dataclass
@@ -62,8 +63,7 @@ class ConflictResolver:
     def capture_pre_sync_states(self) -> None:
         """Capture the current database states before sync starts for change detection"""
         try:
-            cursor = self.state.conn.cursor()
-            cursor.execute("""
+            rows = self.state.conn.execute("""
                 SELECT p.paprika_id, p.name, p.checked as paprika_checked,
                        s.skylight_id, s.checked as skylight_checked
                 FROM item_links l
@@ -72,21 +72,20 @@ class ConflictResolver:
             """)
 
             captured_count = 0
-            for row in cursor.fetchall():
-                key = (row['paprika_id'], row['skylight_id'])
-                self._pre_sync_states[key] = {
-                    'paprika_checked': bool(row['paprika_checked']),
-                    'skylight_checked': bool(row['skylight_checked']),
-                    'name': row['name']
+            for paprika_id, name, paprika_checked, skylight_id, skylight_checked in rows:
+                self._pre_sync_states[(paprika_id, skylight_id)] = {
+                    'paprika_checked': bool(paprika_checked),
+                    'skylight_checked': bool(skylight_checked),
+                    'name': name
                 }
                 captured_count += 1
 
             logger.info(f"📸 Captured pre-sync states for {captured_count} linked items")
-            if captured_count > 0:
+            if captured_count > 0 and logger.isEnabledFor(logging.DEBUG):
                 # Show a sample for debugging
-                sample_items = list(self._pre_sync_states.items())[:3]
-                for key, state in sample_items:
-                    logger.debug(f"  Sample: {state['name']} - P:{state['paprika_checked']}, S:{state['skylight_checked']}")
+                for state in islice(self._pre_sync_states.values(), 3):
+                    logger.debug("  Sample: %s - P:%s, S:%s",
+                                 state['name'], state['paprika_checked'], state['skylight_checked'])
 
         except Exception as e:
             logger.error(f"Failed to capture pre-sync states: {e}")
@@ -111,44 +110,75 @@ class ConflictResolver:
         logger.info(f"Found {len(conflicts)} conflicts to resolve")
 
         # DEBUG: Log details about each conflict
-        for i, conflict in enumerate(conflicts):
-            p_item = conflict.paprika_item
-            s_item = conflict.skylight_item
-            logger.info(f"  Conflict {i+1}: '{p_item.name}' - Paprika={p_item.checked}, Skylight={s_item.checked}")
+        if logger.isEnabledFor(logging.INFO):
+            for i, conflict in enumerate(conflicts, 1):
+                logger.info("  Conflict %d: '%s' - Paprika=%s, Skylight=%s", i,
+                            conflict.paprika_item.name, conflict.paprika_item.checked,
+                            conflict.skylight_item.checked)
 
         if not conflicts:
             return []
 
         resolutions = []
+        # (conflict, resolution, (paprika_id, checked)) waiting on the batched Paprika update
+        deferred = []
         for conflict in conflicts:
             try:
-                resolution = self._resolve_single_conflict(
+                resolution, paprika_update = self._resolve_single_conflict(
                     conflict, paprika_list_name, skylight_list_name
                 )
-                resolutions.append(resolution)
-
-                # Log the resolution
-                self.state.log_sync_operation(
-                    'CONFLICT',
-                    paprika_item_id=conflict.paprika_item_id,
-                    skylight_item_id=conflict.skylight_item_id,
-                    details=f"Resolved conflict: {resolution.winner} wins, "
-                           f"action: {resolution.action_taken}"
-                )
 
-                logger.info(f"✅ Resolved conflict for '{resolution.item_name}': "
-                           f"{resolution.winner} wins ({resolution.action_taken})")
+                if paprika_update:
+                    deferred.append((conflict, resolution, paprika_update))
+                else:
+                    self._record_resolution(conflict, resolution)
+                    resolutions.append(resolution)
 
             except Exception as e:
                 logger.error(f"❌ Failed to resolve conflict for item {conflict.paprika_item.name}: {e}")
                 # Continue with other conflicts
 
+        if deferred:
+            try:
+                updated_ids = set(self.paprika.update_items(
+                    [(paprika_id, checked, None) for _, _, (paprika_id, checked) in deferred],
+                    list_name=paprika_list_name
+                ))
+
+                # Items missing from Paprika were skipped; only record the applied ones
+                for conflict, resolution, (paprika_id, checked) in deferred:
+                    if paprika_id in updated_ids:
+                        # IMPORTANT: Update our database records for Paprika to reflect the change
+                        # This ensures future change detection works correctly
+                        self._update_paprika_database_state(paprika_id, checked)
+                        self._record_resolution(conflict, resolution)
+                        resolutions.append(resolution)
+                    else:
+                        logger.error(f"❌ Failed to resolve conflict for item {conflict.paprika_item.name}: "
+                                     f"item not found in Paprika")
+
+            except Exception as e:
+                logger.error(f"❌ Failed to update {len(deferred)} conflicting items in Paprika: {e}")
+
         logger.info(f"Successfully resolved {len(resolutions)}/{len(conflicts)} conflicts")
         return resolutions
 
+    def _record_resolution(self, conflict: ItemLink, resolution: ConflictResolution) -> None:
+        """Log an applied conflict resolution to the sync log"""
+        self.state.log_sync_operation(
+            'CONFLICT',
+            paprika_item_id=conflict.paprika_item_id,
+            skylight_item_id=conflict.skylight_item_id,
+            details=f"Resolved conflict: {resolution.winner} wins, "
+                   f"action: {resolution.action_taken}"
+        )
+
+        logger.info("✅ Resolved conflict for '%s': %s wins (%s)",
+                    resolution.item_name, resolution.winner, resolution.action_taken)
+
     def _resolve_single_conflict(self, conflict: ItemLink,
                                 paprika_list_name: str,
-                                skylight_list_name: str) -> ConflictResolution:
+                                skylight_list_name: str) -> Tuple[ConflictResolution, Optional[Tuple[str, bool]]]:
         """
         Resolve a single conflict using the configured strategy
 
@@ -158,25 +188,26 @@ class ConflictResolver:
             skylight_list_name: Name of Skylight list
 
         Returns:
-            ConflictResolution result
+            Tuple of (ConflictResolution, pending (paprika_id, checked) update or None)
         """
         p_item = conflict.paprika_item
         s_item = conflict.skylight_item
 
-        logger.debug(f"Resolving conflict for '{p_item.name}': "
-                    f"Paprika={p_item.checked}, Skylight={s_item.checked}")
+        logger.debug("Resolving conflict for '%s': Paprika=%s, Skylight=%s",
+                     p_item.name, p_item.checked, s_item.checked)
 
         # Determine winner based on strategy
         winner, action, confidence = self._determine_winner(p_item, s_item)
 
         # Apply the resolution
+        paprika_update = None
         if not self.dry_run:
-            self._apply_resolution(
+            paprika_update = self._apply_resolution(
                 winner, p_item, s_item,
                 paprika_list_name, skylight_list_name
             )
 
-        return ConflictResolution(
+        resolution = ConflictResolution(
             paprika_item_id=conflict.paprika_item_id,
             skylight_item_id=conflict.skylight_item_id,
             item_name=p_item.name,
@@ -188,6 +219,7 @@ class ConflictResolver:
             paprika_timestamp=p_item.last_modified_at,
             skylight_timestamp=s_item.skylight_updated_at
         )
+        return resolution, paprika_update
 
     def _determine_winner(self, p_item, s_item) -> Tuple[str, str, float]:
         """
@@ -248,9 +280,8 @@ class ConflictResolver:
             time_diff = (p_timestamp - s_timestamp).total_seconds()
 
             # DEBUG: Log actual timestamps for debugging
-            logger.debug(f"Timestamp comparison for '{p_item.name}': "
-                        f"Paprika={p_timestamp}, Skylight={s_timestamp}, "
-                        f"diff={time_diff:.1f}s")
+            logger.debug("Timestamp comparison for '%s': Paprika=%s, Skylight=%s, diff=%.1fs",
+                         p_item.name, p_timestamp, s_timestamp, time_diff)
 
             if abs(time_diff) <= self.timestamp_tolerance_seconds:
                 # Timestamps are very close - favor the change detection over timestamp comparison
@@ -282,11 +313,13 @@ class ConflictResolver:
             key = (p_item.paprika_id, s_item.skylight_id)
             pre_sync_state = self._pre_sync_states.get(key)
 
-            logger.debug(f"🔍 Change detection for '{p_item.name}': key={key}, has_state={pre_sync_state is not None}")
+            logger.debug("🔍 Change detection for '%s': key=%s, has_state=%s",
+                         p_item.name, key, pre_sync_state is not None)
 
             if not pre_sync_state:
-                logger.debug(f"No pre-sync state found for {p_item.name} (key: {key})")
-                logger.debug(f"Available keys: {list(self._pre_sync_states.keys())[:5]}...")  # Show first 5
+                logger.debug("No pre-sync state found for %s (key: %s)", p_item.name, key)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Available keys: %s...", list(islice(self._pre_sync_states, 5)))  # Show first 5
                 return None
 
             # Get the states before sync started
@@ -301,19 +334,19 @@ class ConflictResolver:
             paprika_changed = (last_paprika_checked != current_paprika_checked)
             skylight_changed = (last_skylight_checked != current_skylight_checked)
 
-            logger.info(f"🔍 Change detection for '{p_item.name}': "
-                       f"Paprika {last_paprika_checked}→{current_paprika_checked} (changed={paprika_changed}), "
-                       f"Skylight {last_skylight_checked}→{current_skylight_checked} (changed={skylight_changed})")
+            logger.info("🔍 Change detection for '%s': Paprika %s→%s (changed=%s), Skylight %s→%s (changed=%s)",
+                        p_item.name, last_paprika_checked, current_paprika_checked, paprika_changed,
+                        last_skylight_checked, current_skylight_checked, skylight_changed)
 
             if skylight_changed and not paprika_changed:
-                logger.info(f"🎯 SKYLIGHT CHANGED: '{p_item.name}' - Skylight should win!")
+                logger.info("🎯 SKYLIGHT CHANGED: '%s' - Skylight should win!", p_item.name)
                 return ("skylight", 0.95)  # High confidence - only Skylight changed
             elif paprika_changed and not skylight_changed:
-                logger.info(f"🎯 PAPRIKA CHANGED: '{p_item.name}' - Paprika should win!")
+                logger.info("🎯 PAPRIKA CHANGED: '%s' - Paprika should win!", p_item.name)
                 return ("paprika", 0.95)   # High confidence - only Paprika changed
             elif paprika_changed and skylight_changed:
                 # Both changed - can't determine source, fall back to timestamps
-                logger.info(f"🤔 Both systems changed for '{p_item.name}', falling back to timestamps")
+                logger.info("🤔 Both systems changed for '%s', falling back to timestamps", p_item.name)
                 return None
             else:
                 # Neither changed according to our records - this shouldn't happen in a conflict
@@ -325,7 +358,7 @@ class ConflictResolver:
             return None
 
     def _apply_resolution(self, winner: str, p_item, s_item,
-                         paprika_list_name: str, skylight_list_name: str) -> None:
+                         paprika_list_name: str, skylight_list_name: str) -> Optional[Tuple[str, bool]]:
         """
         Apply the conflict resolution by updating the losing system
 
@@ -335,25 +368,25 @@ class ConflictResolver:
             s_item: Skylight item
             paprika_list_name: Name of Paprika list
             skylight_list_name: Name of Skylight list
+
+        Returns:
+            (paprika_id, checked) update for the caller to send to Paprika, or None
         """
         try:
             if winner.startswith("Paprika"):
                 # Paprika wins - update Skylight
                 self.skylight.update_item(s_item.skylight_id, p_item.checked, list_name=skylight_list_name)
-                logger.debug(f"Updated Skylight item {s_item.name} to checked={p_item.checked}")
+                logger.debug("Updated Skylight item %s to checked=%s", s_item.name, p_item.checked)
 
                 # IMPORTANT: Update our database record for Skylight to reflect the change
                 # This ensures future change detection works correctly
                 self._update_skylight_database_state(s_item.skylight_id, p_item.checked)
 
             elif winner.startswith("Skylight"):
-                # Skylight wins - update Paprika
-                self.paprika.update_item(p_item.paprika_id, s_item.checked, list_name=paprika_list_name)
-                logger.debug(f"Updated Paprika item {p_item.name} to checked={s_item.checked}")
-
-                # IMPORTANT: Update our database record for Paprika to reflect the change
-                # This ensures future change detection works correctly
-                self._update_paprika_database_state(p_item.paprika_id, s_item.checked)
+                # Skylight wins - hand the Paprika update back; resolve_all_conflicts sends
+                # all of them in one request and then updates our database records
+                logger.debug("Queued Paprika item %s update to checked=%s", p_item.name, s_item.checked)
+                return p_item.paprika_id, s_item.checked
 
             else:
                 logger.warning(f"Unknown winner format: {winner}")
@@ -362,31 +395,21 @@ class ConflictResolver:
             logger.error(f"Failed to apply resolution for {p_item.name}: {e}")
             raise
 
+        return None
+
     def _update_skylight_database_state(self, skylight_id: str, new_checked_state: bool) -> None:
         """Update Skylight item's checked state in our database"""
         try:
-            cursor = self.state.conn.cursor()
-            cursor.execute("""
-                UPDATE skylight_items
-                SET checked = ?
-                WHERE skylight_id = ?
-            """, (new_checked_state, skylight_id))
-            self.state.conn.commit()
-            logger.debug(f"Updated Skylight database state: {skylight_id} checked={new_checked_state}")
+            self.state.set_skylight_item_checked(skylight_id, new_checked_state)
+            logger.debug("Updated Skylight database state: %s checked=%s", skylight_id, new_checked_state)
         except Exception as e:
             logger.error(f"Failed to update Skylight database state: {e}")
 
     def _update_paprika_database_state(self, paprika_id: str, new_checked_state: bool) -> None:
         """Update Paprika item's checked state in our database"""
         try:
-            cursor = self.state.conn.cursor()
-            cursor.execute("""
-                UPDATE paprika_items
-                SET checked = ?
-                WHERE paprika_id = ?
-            """, (new_checked_state, paprika_id))
-            self.state.conn.commit()
-            logger.debug(f"Updated Paprika database state: {paprika_id} checked={new_checked_state}")
+            self.state.set_paprika_item_checked(paprika_id, new_checked_state)
+            logger.debug("Updated Paprika database state: %s checked=%s", paprika_id, new_checked_state)
         except Exception as e:
             logger.error(f"Failed to update Paprika database state: {e}")
 
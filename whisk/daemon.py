@@ -8,6 +8,7 @@ with proper PID file management and signal handling.
 import os
 import signal
 import sys
+import threading
 import time
 import logging
 from pathlib import Path
@@ -36,6 +37,7 @@ class DaemonManager:
         self.config_dir = config_dir or Path.cwd()
         self.pid_file = self.config_dir / pid_file
         self.sync_engine = None
+        self._stop_event = threading.Event()  # Set by the signal handler to end the sync loop
 
     def is_running(self) -> bool:
         """
@@ -144,7 +146,12 @@ class DaemonManager:
                 # Force kill if it doesn't respond to SIGTERM
                 logger.warning(f"Process {pid} didn't respond to SIGTERM, sending SIGKILL")
                 os.kill(pid, signal.SIGKILL)
-                time.sleep(1)
+
+                # Wait for the kill to land (up to 2 seconds)
+                for _ in range(40):
+                    if not psutil.pid_exists(pid):
+                        break
+                    time.sleep(0.05)
 
             # Clean up PID file
             self.pid_file.unlink(missing_ok=True)
@@ -255,7 +262,7 @@ class DaemonManager:
         sync_interval = self.config.sync_interval_seconds
         logger.info(f"Starting sync loop with {sync_interval}s intervals")
 
-        while True:
+        while not self._stop_event.is_set():
             try:
                 logger.debug("Performing scheduled sync...")
 
@@ -270,26 +277,25 @@ class DaemonManager:
                     for error in result.errors[:3]:  # Log first 3 errors
                         logger.warning(f"   {error}")
 
-                # Sleep until next sync
-                time.sleep(sync_interval)
+                # Sleep until next sync, waking immediately on shutdown
+                self._stop_event.wait(sync_interval)
 
             except KeyboardInterrupt:
                 break
             except Exception as e:
                 logger.error(f"Sync failed: {e}")
                 # Continue running even if sync fails
-                time.sleep(sync_interval)
+                self._stop_event.wait(sync_interval)
 
     def _signal_handler(self, signum: int, frame) -> None:
         """Handle shutdown signals gracefully"""
         logger.info(f"Received signal {signum}, shutting down gracefully...")
 
+        # Wake the sync loop so it exits instead of sleeping out the interval;
+        # _run_daemon then removes the PID file on its normal exit path
+        self._stop_event.set()
+
         # Graceful shutdown
         if self.sync_engine:
             logger.info("Stopping sync engine...")
-            # Sync engine doesn't need explicit cleanup
-
-        # Clean up PID file
-        self.pid_file.unlink(missing_ok=True)
-        logger.info("Daemon shutdown complete")
-        sys.exit(0)
\ No newline at end of file
+            # Sync engine doesn't need explicit cleanup
\ No newline at end of file
@@ -1,14 +1,54 @@
 """Item linking algorithm with fuzzy matching for duplicate name handling"""
 
+import functools
 import logging
-from typing import List, Tuple, Optional
+import sys
+from collections import Counter, defaultdict
+from typing import Dict, List, Tuple, Optional
 from dataclasses import dataclass
 from difflib import SequenceMatcher
 
 from .state_manager import StateManager, PaprikaItem, SkylightItem
 
+try:
+    from rapidfuzz import fuzz, process  # Optional C implementation, see use_rapidfuzz
+except ImportError:
+    fuzz = process = None
+
 logger = logging.getLogger(__name__)
 
+SIMILARITY_CACHE_SIZE = 4096  # Normalized name pairs whose scores are kept
+
+# Best possible similarity for two different names (of 2+ characters) sharing no
+# bigram: every matched character is its own block, separated by a gap, so
+# 2*M/(len1+len2) <= 2*M/(3*M-1) <= 0.8. Thresholds above it may prefilter on bigrams.
+NO_SHARED_BIGRAM_MAX_SIMILARITY = 0.8
+
+
+@functools.lru_cache(maxsize=SIMILARITY_CACHE_SIZE)
+def _similarity(norm1: str, norm2: str, use_rapidfuzz: bool = False) -> float:
+    """
+    Score two normalized names, memoized so duplicate names are scored once
+
+    Args:
+        norm1: First normalized name
+        norm2: Second normalized name
+        use_rapidfuzz: Score with rapidfuzz instead of SequenceMatcher
+
+    Returns:
+        Similarity score (0.0 to 1.0)
+    """
+    # Identical names need no sequence matching
+    if norm1 == norm2:
+        return 1.0
+
+    # rapidfuzz's ratio is faster but can score borderline names differently
+    # from SequenceMatcher, so it is only used when explicitly enabled
+    if use_rapidfuzz:
+        return fuzz.ratio(norm1, norm2) / 100.0
+
+    return SequenceMatcher(None, norm1, norm2).ratio()
+
 
 @dataclass
 class ItemMatch:
@@ -41,6 +81,15 @@ class ItemLinker:
         self.case_sensitive = self.config.get('case_sensitive', False)
         self.exact_name_match = self.config.get('exact_name_match', True)
         self.fuzzy_matching = self.config.get('fuzzy_matching', True)
+        self.use_rapidfuzz = self.config.get('use_rapidfuzz', False)
+
+        if self.use_rapidfuzz and fuzz is None:
+            logger.warning("use_rapidfuzz is enabled but rapidfuzz is not installed, "
+                           "falling back to difflib")
+            self.use_rapidfuzz = False
+
+        # Raw name -> normalized name, so repeated names are normalized only once
+        self._normalized_names: Dict[str, str] = {}
 
     def link_all_items(self) -> List[ItemMatch]:
         """
@@ -81,24 +130,28 @@ class ItemLinker:
             fuzzy_matches = self._find_fuzzy_matches(remaining_paprika, remaining_skylight)
             logger.info(f"Found {len(fuzzy_matches)} fuzzy matches")
 
-        # Apply all matches
+        # Apply all matches in a single transaction
         all_matches = exact_matches + fuzzy_matches
         applied_matches = []
 
-        for match in all_matches:
-            try:
-                link = self.state.create_item_link(
-                    match.paprika_item.id,
-                    match.skylight_item.id,
-                    match.confidence_score
-                )
+        try:
+            created = self.state.create_item_links_bulk([
+                (match.paprika_item.id, match.skylight_item.id, match.confidence_score)
+                for match in all_matches
+            ])
+        except Exception as e:
+            logger.error(f"Failed to link {len(all_matches)} matched items: {e}")
+            created = []
 
-                applied_matches.append(match)
-                logger.info(f"Linked: '{match.paprika_item.name}' ↔ '{match.skylight_item.name}' "
-                           f"(confidence: {match.confidence_score:.2f}, reason: {match.match_reason})")
+        created_pairs = {(link.paprika_item_id, link.skylight_item_id) for link in created}
+        for match in all_matches:
+            if (match.paprika_item.id, match.skylight_item.id) not in created_pairs:
+                continue
 
-            except Exception as e:
-                logger.error(f"Failed to link {match.paprika_item.name} ↔ {match.skylight_item.name}: {e}")
+            applied_matches.append(match)
+            logger.info("Linked: '%s' ↔ '%s' (confidence: %.2f, reason: %s)",
+                        match.paprika_item.name, match.skylight_item.name,
+                        match.confidence_score, match.match_reason)
 
         logger.info(f"Successfully linked {len(applied_matches)} items")
         return applied_matches
@@ -186,17 +239,35 @@ class ItemLinker:
         """
         matches = []
 
-        for p_item in paprika_items:
-            best_match = None
-            best_score = 0.0
+        # Normalize each name once instead of once per compared pair
+        skylight_names = [self._normalize_name(s_item.name) for s_item in skylight_items]
 
-            for s_item in skylight_items:
-                # Calculate similarity
-                similarity = self._calculate_similarity(p_item.name, s_item.name)
+        # Index Skylight names by bigram so names with no lexical overlap are never scored
+        bigram_index = None
+        if self.fuzzy_threshold > NO_SHARED_BIGRAM_MAX_SIMILARITY:
+            bigram_index = defaultdict(set)
+            for index, s_name in enumerate(skylight_names):
+                for i in range(len(s_name) - 1):
+                    bigram_index[s_name[i:i + 2]].add(index)
 
-                if similarity >= self.fuzzy_threshold and similarity > best_score:
-                    best_match = s_item
-                    best_score = similarity
+        for p_item in paprika_items:
+            p_name = self._normalize_name(p_item.name)
+
+            if bigram_index is None or len(p_name) < 2:
+                best_match, best_score = self._best_fuzzy_candidate(
+                    p_name, skylight_items, skylight_names)
+            else:
+                candidates = set()
+                for i in range(len(p_name) - 1):
+                    candidates.update(bigram_index.get(p_name[i:i + 2], ()))
+                if not candidates:
+                    continue
+
+                # Keep list order so ties still go to the earliest candidate
+                candidates = sorted(candidates)
+                best_match, best_score = self._best_fuzzy_candidate(
+                    p_name, [skylight_items[i] for i in candidates],
+                    [skylight_names[i] for i in candidates])
 
             if best_match:
                 matches.append(ItemMatch(
@@ -216,6 +287,52 @@ class ItemLinker:
 
         return list(unique_matches.values())
 
+    def _best_fuzzy_candidate(self, p_name: str, skylight_items: List[SkylightItem],
+                              skylight_names: List[str]) -> Tuple[Optional[SkylightItem], float]:
+        """
+        Find the Skylight item whose name best matches a Paprika name
+
+        Args:
+            p_name: Normalized Paprika item name
+            skylight_items: Candidate Skylight items
+            skylight_names: Normalized names, parallel to skylight_items
+
+        Returns:
+            (best item, score), or (None, 0.0) if nothing reaches the threshold
+        """
+        # rapidfuzz scores the whole candidate list in one C call and applies
+        # the cutoff (and its own length pruning) internally
+        if self.use_rapidfuzz:
+            best = process.extractOne(p_name, skylight_names, scorer=fuzz.ratio,
+                                      processor=None, score_cutoff=self.fuzzy_threshold * 100)
+            if best is None:
+                return None, 0.0
+            _, score, index = best
+            return skylight_items[index], score / 100.0
+
+        best_match = None
+        best_score = 0.0
+        p_len = len(p_name)
+
+        for s_item, s_name in zip(skylight_items, skylight_names):
+            # Similarity is 2*matches/(len1+len2), so the shorter length caps it;
+            # skip pairs whose lengths alone rule out reaching the threshold
+            s_len = len(s_name)
+            if 2 * min(p_len, s_len) < self.fuzzy_threshold * (p_len + s_len):
+                continue
+
+            # Calculate similarity
+            similarity = self._normalized_similarity(p_name, s_name)
+
+            if similarity >= self.fuzzy_threshold and similarity > best_score:
+                best_match = s_item
+                best_score = similarity
+
+                if best_score == 1.0:
+                    break  # Nothing can beat an identical name
+
+        return best_match, best_score
+
     def _pair_by_timing(self, paprika_group: List[PaprikaItem],
                        skylight_group: List[SkylightItem]) -> List[Tuple[PaprikaItem, SkylightItem, float]]:
         """
@@ -298,12 +415,20 @@ class ItemLinker:
         Returns:
             Similarity score (0.0 to 1.0)
         """
-        # Normalize names
-        norm1 = self._normalize_name(name1)
-        norm2 = self._normalize_name(name2)
+        return self._normalized_similarity(self._normalize_name(name1), self._normalize_name(name2))
 
-        # Use SequenceMatcher for similarity
-        return SequenceMatcher(None, norm1, norm2).ratio()
+    def _normalized_similarity(self, norm1: str, norm2: str) -> float:
+        """
+        Calculate similarity between two already-normalized names
+
+        Args:
+            norm1: First normalized name
+            norm2: Second normalized name
+
+        Returns:
+            Similarity score (0.0 to 1.0)
+        """
+        return _similarity(norm1, norm2, self.use_rapidfuzz)
 
     def _normalize_name(self, name: str) -> str:
         """
@@ -315,6 +440,11 @@ class ItemLinker:
         Returns:
             Normalized name
         """
+        normalized = self._normalized_names.get(name)
+        if normalized is not None:
+            return normalized
+
+        original = name
         if not self.case_sensitive:
             name = name.lower()
 
@@ -324,6 +454,8 @@ class ItemLinker:
         # Additional normalizations can be added here
         # e.g., remove punctuation, handle plurals, etc.
 
+        name = sys.intern(name)
+        self._normalized_names[original] = name
         return name
 
     def get_linking_summary(self) -> dict:
@@ -339,22 +471,11 @@ class ItemLinker:
             unlinked_paprika = self.state.get_unlinked_paprika_items()
             unlinked_skylight = self.state.get_unlinked_skylight_items()
 
-            # Group unlinked items by name to identify potential matches
-            paprika_names = {}
-            for item in unlinked_paprika:
-                name_key = self._normalize_name(item.name)
-                if name_key not in paprika_names:
-                    paprika_names[name_key] = 0
-                paprika_names[name_key] += 1
-
-            skylight_names = {}
-            for item in unlinked_skylight:
-                name_key = self._normalize_name(item.name)
-                if name_key not in skylight_names:
-                    skylight_names[name_key] = 0
-                skylight_names[name_key] += 1
-
-            potential_exact_matches = len(set(paprika_names.keys()) & set(skylight_names.keys()))
+            # Count unlinked items by name to identify potential matches
+            paprika_names = Counter(self._normalize_name(item.name) for item in unlinked_paprika)
+            skylight_names = Counter(self._normalize_name(item.name) for item in unlinked_skylight)
+
+            potential_exact_matches = len(paprika_names.keys() & skylight_names.keys())
 
             return {
                 'total_paprika_items': stats['paprika_items'],
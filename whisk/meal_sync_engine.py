@@ -307,22 +307,15 @@ class MealSyncEngine:
             end_date = today + timedelta(days=self.config.meal_sync_days_ahead)
             existing_meals = self.state_manager.get_meals(today, end_date)
 
-            # Create lookup of existing Skylight meals by unique key (date + meal_type)
-            skylight_lookup = {}
-            for meal in skylight_meals:
-                key = f"{meal.date}_{meal.meal_type}"
-                skylight_lookup[key] = meal
+            # Create lookup of existing Skylight meals by unique key (date, meal_type)
+            skylight_lookup = {(meal.date, meal.meal_type): meal for meal in skylight_meals}
 
-            # Group Paprika meals by date + meal_type to handle multiple meals per type
+            # Group Paprika meals by (date, meal_type) to handle multiple meals per type
             paprika_groups = {}
             for meal in paprika_meals:
-                key = f"{meal.date}_{meal.meal_type}"
-                if key not in paprika_groups:
-                    paprika_groups[key] = []
-                paprika_groups[key].append(meal)
+                paprika_groups.setdefault((meal.date, meal.meal_type), []).append(meal)
 
             # Process each group (may contain multiple meals)
-            processed_meals = []
             for key, meals in paprika_groups.items():
                 if len(meals) == 1:
                     # Single meal - use existing logic
@@ -331,8 +324,6 @@ class MealSyncEngine:
                     # Multiple meals - combine them
                     processed_meal = self._combine_paprika_meals(meals)
 
-                processed_meals.append(processed_meal)
-
                 # Check against existing Skylight meal
                 existing_skylight = skylight_lookup.get(key)
 
@@ -349,12 +340,9 @@ class MealSyncEngine:
                 # Save processed meal state to database
                 self.state_manager.save_meal(processed_meal)
 
-            # Handle deleted meals (meals in Skylight but not in processed Paprika groups)
-            paprika_lookup = {f"{meal.date}_{meal.meal_type}": meal for meal in processed_meals}
-
+            # Handle deleted meals (meals in Skylight but not in any Paprika group)
             for meal in skylight_meals:
-                key = f"{meal.date}_{meal.meal_type}"
-                if key not in paprika_lookup:
+                if (meal.date, meal.meal_type) not in paprika_groups:
                     # This meal was deleted from Paprika, remove from Skylight
                     self._delete_skylight_meal(meal)
                     result.meals_deleted.append(meal.name)
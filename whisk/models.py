@@ -1,5 +1,6 @@
 """Data models for list sync"""
 
+import sys
 from dataclasses import dataclass
 from datetime import datetime, timezone, date
 from typing import Optional
@@ -16,6 +17,11 @@ class ListItem:
     paprika_timestamp: Optional[datetime] = None
     skylight_timestamp: Optional[datetime] = None
 
+    def __post_init__(self):
+        # Grocery names repeat across lists and sync runs; share one string per name
+        if isinstance(self.name, str):
+            self.name = sys.intern(self.name)
+
     @property
     def latest_timestamp(self) -> datetime:
         """Return most recent timestamp from either system"""
@@ -7,10 +7,15 @@ Also handles one-way meal sync from Paprika to Skylight.
 """
 
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field, asdict
 from datetime import datetime, timezone
 from typing import Dict, Any, List, Optional, Tuple
 from pathlib import Path
 
+import requests
+from requests.adapters import HTTPAdapter
+
 from .models import ListItem
 from .paprika_client import PaprikaClient
 from .skylight_client import SkylightClient
@@ -22,6 +27,29 @@ from .meal_sync_engine import MealSyncEngine, MealSyncResult
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on concurrent per-item API mutations
+MAX_MUTATION_WORKERS = 8
+
+# Pooled keep-alive connections per host; must cover concurrent mutation workers
+HTTP_POOL_MAXSIZE = max(16, MAX_MUTATION_WORKERS)
+
+
+def _index_by(items: List[ListItem], attr: str) -> Dict[str, ListItem]:
+    """Index items by a service ID attribute, skipping items without one"""
+    return {getattr(item, attr): item for item in items if getattr(item, attr)}
+
+
+@dataclass(slots=True)
+class PairChanges:
+    """Item names changed while syncing a single list pair, by change type"""
+    paprika_created: List[str] = field(default_factory=list)
+    paprika_updated: List[str] = field(default_factory=list)
+    paprika_deleted: List[str] = field(default_factory=list)
+    skylight_created: List[str] = field(default_factory=list)
+    skylight_updated: List[str] = field(default_factory=list)
+    skylight_deleted: List[str] = field(default_factory=list)
+    conflicts_resolved: List[str] = field(default_factory=list)
+
 
 class ListPairSyncResult:
     """Result of syncing a single list pair"""
@@ -136,12 +164,20 @@ class WhiskSyncEngine:
 
     def _init_clients(self):
         """Initialize Paprika and Skylight API clients"""
+        # One pooled session for both clients so connections are kept alive and
+        # sized for the concurrent fetches and mutations
+        self.http_session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=HTTP_POOL_MAXSIZE)
+        self.http_session.mount("https://", adapter)
+        self.http_session.mount("http://", adapter)
+
         # Initialize Paprika client with config directory for token cache
         paprika_token_cache = self.config_dir / self.config.paprika_token_cache
         self.paprika_client = PaprikaClient(
             email=self.config.paprika_email,
             password=self.config.paprika_password,
-            token_cache_file=str(paprika_token_cache)
+            token_cache_file=str(paprika_token_cache),
+            session=self.http_session
         )
 
         # Initialize Skylight client with config directory for token cache
@@ -150,7 +186,8 @@ class WhiskSyncEngine:
             email=self.config.skylight_email,
             password=self.config.skylight_password,
             frame_id=self.config.skylight_frame_id,
-            token_cache_file=str(skylight_token_cache)
+            token_cache_file=str(skylight_token_cache),
+            session=self.http_session
         )
 
     def sync_all_pairs(self, dry_run: bool = False) -> MultiListSyncResult:
@@ -180,6 +217,8 @@ class WhiskSyncEngine:
             result.sync_duration = (datetime.now() - start_time).total_seconds()
             return result
 
+        self.state_manager.start_sync_run()
+
         # Sync each list pair independently
         for i, pair in enumerate(self.config.list_pairs, 1):
             if not pair.enabled:
@@ -205,6 +244,9 @@ class WhiskSyncEngine:
         else:
             logger.info("Meal sync disabled in configuration")
 
+        self.state_manager.prune_sync_log()
+        self.state_manager.end_sync_run()
+
         # Calculate final timing
         result.sync_duration = (datetime.now() - start_time).total_seconds()
 
@@ -262,7 +304,10 @@ class WhiskSyncEngine:
             result.error = f"Authentication failed: {e}"
             return result
 
-        return self._sync_single_pair(pair, dry_run)
+        self.state_manager.start_sync_run()
+        result = self._sync_single_pair(pair, dry_run)
+        self.state_manager.end_sync_run()
+        return result
 
     def _sync_single_pair(self, pair: ListPairConfig, dry_run: bool = False) -> ListPairSyncResult:
         """
@@ -290,7 +335,8 @@ class WhiskSyncEngine:
             # Create components for this pair
             item_linker_config = {
                 'fuzzy_threshold': self.config.fuzzy_threshold,
-                'case_sensitive': self.config.case_sensitive
+                'case_sensitive': self.config.case_sensitive,
+                'use_rapidfuzz': self.config.use_rapidfuzz
             }
             item_linker = ItemLinker(
                 state_manager=self.state_manager,
@@ -310,13 +356,9 @@ class WhiskSyncEngine:
                 conflict_resolver.capture_pre_sync_states()
 
             # Get current items from both services
-            logger.debug(f"Fetching items from {pair.paprika_list} (Paprika)")
-            paprika_items = self.paprika_client.get_grocery_list(pair.paprika_list)
-            logger.debug(f"Fetched {len(paprika_items)} items from Paprika")
-
-            logger.debug(f"Fetching items from {pair.skylight_list} (Skylight)")
-            skylight_items = self.skylight_client.get_list_items(pair.skylight_list)
-            logger.debug(f"Fetched {len(skylight_items)} items from Skylight")
+            logger.debug(f"Fetching items from {pair.paprika_list} (Paprika) and {pair.skylight_list} (Skylight)")
+            paprika_items, skylight_items = self._fetch_pair_items(pair)
+            logger.debug(f"Fetched {len(paprika_items)} items from Paprika, {len(skylight_items)} items from Skylight")
 
             result.items_processed = len(paprika_items) + len(skylight_items)
 
@@ -332,14 +374,16 @@ class WhiskSyncEngine:
                 # Detect and apply all changes
                 logger.debug("Detecting and applying changes...")
                 changes = self._detect_and_apply_changes(
-                    pair, paprika_items, skylight_items, conflict_resolver
+                    pair,
+                    _index_by(paprika_items, 'paprika_id'),
+                    _index_by(skylight_items, 'skylight_id'),
+                    conflict_resolver
                 )
 
                 # Update result with applied changes
-                for change_type, item_names in changes.items():
-                    result.changes_applied[change_type] = item_names
+                result.changes_applied.update(asdict(changes))
 
-                result.conflicts_resolved = len(changes.get('conflicts_resolved', []))
+                result.conflicts_resolved = len(changes.conflicts_resolved)
 
             # Mark as successful
             result.success = True
@@ -349,11 +393,32 @@ class WhiskSyncEngine:
             result.error = str(e)
             result.success = False
 
+        # Persist sync log entries buffered while processing this pair
+        self.state_manager.flush_sync_log()
+
         # Calculate timing
         result.sync_duration = (datetime.now() - start_time).total_seconds()
 
         return result
 
+    def _fetch_pair_items(self, pair: ListPairConfig) -> Tuple[List[ListItem], List[ListItem]]:
+        """
+        Fetch current items for a list pair from both services concurrently
+
+        The two requests go to independent services, so running them in
+        parallel costs max(t_paprika, t_skylight) instead of the sum.
+
+        Args:
+            pair: List pair configuration
+
+        Returns:
+            Tuple of (paprika_items, skylight_items)
+        """
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            paprika_future = executor.submit(self.paprika_client.get_grocery_list, pair.paprika_list)
+            skylight_future = executor.submit(self.skylight_client.get_list_items, pair.skylight_list)
+            return paprika_future.result(), skylight_future.result()
+
     def get_enabled_pairs(self) -> List[ListPairConfig]:
         """Get list of enabled list pairs"""
         return [pair for pair in self.config.list_pairs if pair.enabled]
@@ -365,8 +430,7 @@ class WhiskSyncEngine:
         for pair in self.config.list_pairs:
             try:
                 # Get basic info about the lists
-                paprika_items = self.paprika_client.get_grocery_list(pair.paprika_list)
-                skylight_items = self.skylight_client.get_list_items(pair.skylight_list)
+                paprika_items, skylight_items = self._fetch_pair_items(pair)
 
                 status = {
                     'paprika_list': pair.paprika_list,
@@ -402,17 +466,11 @@ class WhiskSyncEngine:
             pair_id: Unique identifier for this list pair
         """
         try:
-            # Store Paprika items
-            for item in paprika_items:
-                # The state manager expects the list_uid to be available
-                list_uid = getattr(item, 'list_uid', pair_id.split('___')[0])
-                self.state_manager.upsert_paprika_item(item, list_uid)
-
-            # Store Skylight items
-            for item in skylight_items:
-                # The state manager expects the list_id to be available
-                list_id = getattr(item, 'list_id', pair_id.split('___')[1])
-                self.state_manager.upsert_skylight_item(item, list_id)
+            paprika_list_uid, skylight_list_id = pair_id.split('___')
+
+            # Store each side in a single transaction
+            self.state_manager.upsert_paprika_items_bulk(paprika_items, paprika_list_uid)
+            self.state_manager.upsert_skylight_items_bulk(skylight_items, skylight_list_id)
 
             logger.debug(f"Stored {len(paprika_items)} Paprika and {len(skylight_items)} Skylight items")
 
@@ -421,30 +479,22 @@ class WhiskSyncEngine:
             raise
 
     def _detect_and_apply_changes(self, pair: ListPairConfig,
-                                  paprika_items: List[ListItem],
-                                  skylight_items: List[ListItem],
-                                  conflict_resolver) -> Dict[str, List[str]]:
+                                  paprika_by_id: Dict[str, ListItem],
+                                  skylight_by_id: Dict[str, ListItem],
+                                  conflict_resolver) -> PairChanges:
         """
         Detect all types of changes and apply them
 
         Args:
             pair: List pair configuration
-            paprika_items: Current Paprika items
-            skylight_items: Current Skylight items
+            paprika_by_id: Current Paprika items keyed by paprika_id
+            skylight_by_id: Current Skylight items keyed by skylight_id
             conflict_resolver: Configured conflict resolver
 
         Returns:
-            Dictionary of changes made, categorized by type
+            Changes made, categorized by type
         """
-        changes = {
-            'paprika_created': [],
-            'paprika_updated': [],
-            'paprika_deleted': [],
-            'skylight_created': [],
-            'skylight_updated': [],
-            'skylight_deleted': [],
-            'conflicts_resolved': []
-        }
+        changes = PairChanges()
 
         try:
             # 1. Handle conflicts first (items that exist in both but differ)
@@ -455,22 +505,22 @@ class WhiskSyncEngine:
             )
 
             for resolution in conflict_resolutions:
-                changes['conflicts_resolved'].append(resolution.item_name)
-                logger.info(f"Resolved conflict for '{resolution.item_name}': {resolution.winner}")
+                changes.conflicts_resolved.append(resolution.item_name)
+                logger.info("Resolved conflict for '%s': %s", resolution.item_name, resolution.winner)
 
             # 2. Handle new items (exist in one service but not the other)
             self._handle_new_items(pair, changes)
 
             # 3. Handle deleted items (exist in database but missing from API)
-            self._handle_deleted_items(pair, paprika_items, skylight_items, changes)
+            self._handle_deleted_items(pair, paprika_by_id, skylight_by_id, changes)
 
             # 4. Handle other updates (name changes, etc.)
             self._handle_item_updates(pair, changes)
 
             logger.info(f"Applied changes for {pair.paprika_list} ↔ {pair.skylight_list}: "
-                       f"P+{len(changes['paprika_created'])} P~{len(changes['paprika_updated'])} P-{len(changes['paprika_deleted'])} "
-                       f"S+{len(changes['skylight_created'])} S~{len(changes['skylight_updated'])} S-{len(changes['skylight_deleted'])} "
-                       f"Conflicts:{len(changes['conflicts_resolved'])}")
+                       f"P+{len(changes.paprika_created)} P~{len(changes.paprika_updated)} P-{len(changes.paprika_deleted)} "
+                       f"S+{len(changes.skylight_created)} S~{len(changes.skylight_updated)} S-{len(changes.skylight_deleted)} "
+                       f"Conflicts:{len(changes.conflicts_resolved)}")
 
         except Exception as e:
             logger.error(f"Failed to detect and apply changes: {e}")
@@ -478,7 +528,7 @@ class WhiskSyncEngine:
 
         return changes
 
-    def _handle_new_items(self, pair: ListPairConfig, changes: Dict[str, List[str]]) -> None:
+    def _handle_new_items(self, pair: ListPairConfig, changes: PairChanges) -> None:
         """Handle items that exist in one service but not the other"""
         try:
             # Get unlinked items (items that haven't been paired between services)
@@ -486,83 +536,108 @@ class WhiskSyncEngine:
             unlinked_skylight = self.state_manager.get_unlinked_skylight_items()
 
             # Create missing items in Skylight (from unlinked Paprika items)
+            to_create = []
             for p_item in unlinked_paprika:
-                try:
-                    logger.debug(f"Creating item in Skylight: name='{p_item.name}', checked={p_item.checked}")
-
-                    if not p_item.name or not p_item.name.strip():
-                        logger.error(f"Paprika item has empty/blank name: {p_item}")
-                        continue
-
-                    skylight_id = self.skylight_client.add_item(
-                        name=p_item.name,
-                        checked=p_item.checked,
-                        list_name=pair.skylight_list
-                    )
-
-                    # Create a new ListItem to store in database
-                    from .models import ListItem
-                    new_skylight_item = ListItem(
-                        name=p_item.name,
-                        checked=p_item.checked,
-                        skylight_id=skylight_id
-                    )
-
-                    # Store the new Skylight item in database
-                    s_db_item = self.state_manager.upsert_skylight_item(new_skylight_item, pair.skylight_list)
-
-                    # Link the items
-                    self.state_manager.create_item_link(p_item.id, s_db_item.id, confidence_score=1.0)
-
-                    changes['skylight_created'].append(p_item.name)
-                    logger.info(f"Created '{p_item.name}' in {pair.skylight_list}")
-
-                except Exception as e:
-                    logger.error(f"Failed to create '{p_item.name}' in Skylight: {e}")
+                logger.debug("Creating item in Skylight: name='%s', checked=%s", p_item.name, p_item.checked)
+
+                if not p_item.name or not p_item.name.strip():
+                    logger.error(f"Paprika item has empty/blank name: {p_item}")
+                    continue
+
+                to_create.append(p_item)
+
+            if to_create:
+                # Skylight has no batch create, so overlap the independent POSTs.
+                # Database writes happen on this thread once they have all completed.
+                with ThreadPoolExecutor(max_workers=MAX_MUTATION_WORKERS) as executor:
+                    futures = {
+                        executor.submit(
+                            self.skylight_client.add_item,
+                            name=p_item.name,
+                            checked=p_item.checked,
+                            list_name=pair.skylight_list
+                        ): p_item
+                        for p_item in to_create
+                    }
+
+                    created = []
+                    for future in as_completed(futures):
+                        p_item = futures[future]
+                        try:
+                            created.append((p_item, future.result()))
+                        except Exception as e:
+                            logger.error(f"Failed to create '{p_item.name}' in Skylight: {e}")
+
+                if created:
+                    try:
+                        # Store the new Skylight items and link them, one transaction each
+                        s_db_items = self.state_manager.upsert_skylight_items_bulk(
+                            [ListItem(name=p_item.name, checked=p_item.checked, skylight_id=skylight_id)
+                             for p_item, skylight_id in created],
+                            pair.skylight_list
+                        )
+                        self.state_manager.create_item_links_bulk(
+                            [(p_item.id, s_db_item.id, 1.0)
+                             for (p_item, _), s_db_item in zip(created, s_db_items)]
+                        )
+
+                        for p_item, _ in created:
+                            changes.skylight_created.append(p_item.name)
+                            logger.info("Created '%s' in %s", p_item.name, pair.skylight_list)
+
+                    except Exception as e:
+                        logger.error(f"Failed to record {len(created)} items created in Skylight: {e}")
 
             # Create missing items in Paprika (from unlinked Skylight items)
+            to_create = []
             for s_item in unlinked_skylight:
-                try:
-                    logger.debug(f"Creating item in Paprika: name='{s_item.name}', checked={s_item.checked}")
+                logger.debug("Creating item in Paprika: name='%s', checked=%s", s_item.name, s_item.checked)
 
-                    if not s_item.name or not s_item.name.strip():
-                        logger.error(f"Skylight item has empty/blank name: {s_item}")
-                        continue
+                if not s_item.name or not s_item.name.strip():
+                    logger.error(f"Skylight item has empty/blank name: {s_item}")
+                    continue
 
-                    paprika_id = self.paprika_client.add_item(
-                        name=s_item.name,
-                        checked=s_item.checked,
-                        list_name=pair.paprika_list
-                    )
+                to_create.append(s_item)
 
-                    # Create a new ListItem to store in database
-                    from .models import ListItem
-                    new_paprika_item = ListItem(
-                        name=s_item.name,
-                        checked=s_item.checked,
-                        paprika_id=paprika_id
+            if to_create:
+                # Paprika accepts an array of groceries, so create them all in one request
+                try:
+                    paprika_ids = self.paprika_client.add_items(
+                        [(s_item.name, s_item.checked) for s_item in to_create],
+                        list_name=pair.paprika_list
                     )
-
-                    # Store the new Paprika item in database
-                    p_db_item = self.state_manager.upsert_paprika_item(new_paprika_item, pair.paprika_list)
-
-                    # Link the items
-                    self.state_manager.create_item_link(p_db_item.id, s_item.id, confidence_score=1.0)
-
-                    changes['paprika_created'].append(s_item.name)
-                    logger.info(f"Created '{s_item.name}' in {pair.paprika_list}")
-
                 except Exception as e:
-                    logger.error(f"Failed to create '{s_item.name}' in Paprika: {e}")
+                    logger.error(f"Failed to create {len(to_create)} items in Paprika: {e}")
+                    paprika_ids = []
+
+                if paprika_ids:
+                    try:
+                        # Store the new Paprika items and link them, one transaction each
+                        p_db_items = self.state_manager.upsert_paprika_items_bulk(
+                            [ListItem(name=s_item.name, checked=s_item.checked, paprika_id=paprika_id)
+                             for s_item, paprika_id in zip(to_create, paprika_ids)],
+                            pair.paprika_list
+                        )
+                        self.state_manager.create_item_links_bulk(
+                            [(p_db_item.id, s_item.id, 1.0)
+                             for s_item, p_db_item in zip(to_create, p_db_items)]
+                        )
+
+                        for s_item in to_create:
+                            changes.paprika_created.append(s_item.name)
+                            logger.info("Created '%s' in %s", s_item.name, pair.paprika_list)
+
+                    except Exception as e:
+                        logger.error(f"Failed to record {len(to_create)} items created in Paprika: {e}")
 
         except Exception as e:
             logger.error(f"Failed to handle new items: {e}")
             raise
 
     def _handle_deleted_items(self, pair: ListPairConfig,
-                              paprika_items: List[ListItem],
-                              skylight_items: List[ListItem],
-                              changes: Dict[str, List[str]]) -> None:
+                              paprika_by_id: Dict[str, ListItem],
+                              skylight_by_id: Dict[str, ListItem],
+                              changes: PairChanges) -> None:
         """Handle items that were deleted from one of the services"""
         try:
             logger.debug("Handling deleted items...")
@@ -572,12 +647,11 @@ class WhiskSyncEngine:
             paprika_list_uid = pair_id.split('___')[0]  # Use paprika list name as UID
             skylight_list_id = pair_id.split('___')[1]  # Use skylight list name as list_id
 
-            # Get all linked items for this pair from database
-            linked_items = self.state_manager.get_linked_items_for_pair(paprika_list_uid, skylight_list_id)
-
-            # Create sets of current item IDs for fast lookup
-            current_paprika_ids = {item.paprika_id for item in paprika_items if item.paprika_id}
-            current_skylight_ids = {item.skylight_id for item in skylight_items if item.skylight_id}
+            # Only links whose Paprika item was not stamped by this sync run can be deletions
+            linked_items = self.state_manager.get_unseen_linked_items_for_pair(paprika_list_uid, skylight_list_id)
+            if not linked_items:
+                logger.debug("No linked Paprika items missing from this sync, skipping deletion check")
+                return
 
             # Find items that were in database but missing from current API responses
             deleted_skylight_ids = []
@@ -589,18 +663,18 @@ class WhiskSyncEngine:
 
                 # Check for Paprika → Skylight deletions
                 # If Paprika item is missing from current response, delete from Skylight
-                if paprika_item and paprika_item.paprika_id not in current_paprika_ids:
+                if paprika_item and paprika_item.paprika_id not in paprika_by_id:
                     if skylight_item and skylight_item.skylight_id:
                         deleted_skylight_ids.append(skylight_item.skylight_id)
                         deleted_item_names.append(paprika_item.name)
-                        logger.debug(f"Item '{paprika_item.name}' deleted from Paprika, will remove from Skylight")
+                        logger.debug("Item '%s' deleted from Paprika, will remove from Skylight", paprika_item.name)
 
             # Bulk delete items from Skylight if any found
             if deleted_skylight_ids:
                 logger.info(f"Found {len(deleted_skylight_ids)} items deleted from Paprika, removing from Skylight")
                 try:
                     self.skylight_client.bulk_delete_items(deleted_skylight_ids, pair.skylight_list)
-                    changes['skylight_deleted'].extend(deleted_item_names)
+                    changes.skylight_deleted.extend(deleted_item_names)
                     logger.info(f"Successfully deleted {len(deleted_skylight_ids)} items from Skylight")
                 except Exception as e:
                     logger.error(f"Failed to bulk delete items from Skylight: {e}")
@@ -617,7 +691,7 @@ class WhiskSyncEngine:
             logger.error(f"Failed to handle deleted items: {e}")
             raise
 
-    def _handle_item_updates(self, pair: ListPairConfig, changes: Dict[str, List[str]]) -> None:
+    def _handle_item_updates(self, pair: ListPairConfig, changes: PairChanges) -> None:
         """Handle other types of updates like name changes"""
         # This is a placeholder for handling name changes and other updates
         # For now, we focus on the core sync functionality
@@ -3,9 +3,12 @@
 import gzip
 import json
 import logging
+import os
+import tempfile
+import uuid
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterable, Tuple
 
 import requests
 
@@ -19,7 +22,8 @@ class PaprikaClient:
 
     BASE_URL = "https://www.paprikaapp.com/api"
 
-    def __init__(self, email: str, password: str, token_cache_file: str = "paprika_token"):
+    def __init__(self, email: str, password: str, token_cache_file: str = "paprika_token",
+                 session: Optional[requests.Session] = None):
         """
         Initialize Paprika client with credentials
 
@@ -27,13 +31,22 @@ class PaprikaClient:
             email: Paprika account email
             password: Paprika account password
             token_cache_file: Path to cache authentication token
+            session: Optional shared HTTP session (a new one is created if omitted)
         """
         self.email = email
         self.password = password
         self.token_cache_file = Path(token_cache_file)
         self.token: Optional[str] = None
-        self._session = requests.Session()
+        self._session = session or requests.Session()
         self._grocery_lists_cache: Optional[List[Dict[str, Any]]] = None
+        self._list_uid_by_name: Dict[str, str] = {}
+        # Raw grocery records from the last fetch, keyed by uid
+        self._groceries_by_uid: Dict[str, Dict[str, Any]] = {}
+        # Server groceries revision the snapshot above was fetched at
+        self._groceries_revision: Optional[int] = None
+        # Cleared once /v2/sync/status/ fails or has no groceries counter, so
+        # later fetches skip the extra round trip
+        self._sync_status_available = True
 
     def authenticate(self) -> None:
         """Authenticate with Paprika API using V1 auth (more stable than V2)"""
@@ -77,10 +90,15 @@ class PaprikaClient:
         """Cache authentication token to file to avoid repeated auth"""
         try:
             token_data = {"token": self.token, "email": self.email}
-            with open(self.token_cache_file, "w") as f:
+            # Write to a temp file in the same directory and swap it in, so a
+            # concurrent run never reads a half-written cache
+            with tempfile.NamedTemporaryFile("w", dir=self.token_cache_file.parent,
+                                             prefix=f".{self.token_cache_file.name}.",
+                                             delete=False) as f:
                 json.dump(token_data, f)
-            # Set restrictive permissions (owner only)
-            self.token_cache_file.chmod(0o600)
+            # Set restrictive permissions (owner only) before the file becomes visible
+            os.chmod(f.name, 0o600)
+            os.replace(f.name, self.token_cache_file)
             logger.debug(f"Cached token to {self.token_cache_file}")
         except Exception as e:
             logger.warning(f"Failed to cache token: {e}")
@@ -104,6 +122,9 @@ class PaprikaClient:
                 return False
 
             self.token = token_data.get("token")
+            if not self.token:
+                return False
+
             logger.debug("Loaded cached token")
             return True
 
@@ -116,18 +137,11 @@ class PaprikaClient:
         if self.token:
             return
 
-        # Try loading cached token first
+        # Try loading cached token first; if it has expired the first request
+        # gets a 401 and re-authenticates, so no validation round-trip is needed
         if self._load_cached_token():
-            # Verify token still works by making a test request
-            try:
-                self._make_request("GET", "/v2/sync/groceries/")
-                logger.debug("Cached token is valid")
-                return
-            except Exception as e:
-                logger.debug(f"Cached token invalid: {e}")
-                self.token = None
+            return
 
-        # Cached token didn't work, authenticate fresh
         self.authenticate()
 
     def _make_request(
@@ -225,6 +239,9 @@ class PaprikaClient:
                 logger.debug("Fetching grocery lists from Paprika...")
                 result = self._make_request("GET", "/v2/sync/grocerylists/")
                 self._grocery_lists_cache = result.get("result", [])
+                self._list_uid_by_name = {}
+                for grocery_list in self._grocery_lists_cache:
+                    self._list_uid_by_name.setdefault(grocery_list.get("name"), grocery_list.get("uid"))
                 logger.info(f"Retrieved {len(self._grocery_lists_cache)} grocery lists")
             except Exception as e:
                 logger.error(f"Failed to get grocery lists from Paprika: {e}")
@@ -242,11 +259,49 @@ class PaprikaClient:
         Returns:
             List UID or None if not found
         """
-        lists = self.get_grocery_lists()
-        for grocery_list in lists:
-            if grocery_list.get("name") == list_name:
-                return grocery_list.get("uid")
-        return None
+        self.get_grocery_lists()
+        return self._list_uid_by_name.get(list_name)
+
+    def _get_groceries_revision(self) -> Optional[int]:
+        """
+        Get the server's change counter for groceries from the sync status endpoint
+
+        Returns:
+            Groceries revision, or None if the status endpoint is unavailable
+        """
+        if not self._sync_status_available:
+            return None
+
+        try:
+            result = self._make_request("GET", "/v2/sync/status/")
+            revision = result.get("result", {}).get("groceries")
+        except Exception as e:
+            logger.debug(f"Sync status unavailable, falling back to full grocery fetch: {e}")
+            revision = None
+
+        if revision is None:
+            self._sync_status_available = False
+        return revision
+
+    def _fetch_groceries(self) -> Iterable[Dict[str, Any]]:
+        """
+        Fetch all raw grocery records, reusing the uid snapshot if the server's
+        groceries revision has not moved since it was fetched
+
+        Returns:
+            Raw grocery dictionaries across all lists (a live view of the
+            snapshot when reused, so iterate it without mutating the client)
+        """
+        revision = self._get_groceries_revision()
+        if revision is not None and revision == self._groceries_revision:
+            logger.debug(f"Groceries unchanged at revision {revision}, reusing snapshot")
+            return self._groceries_by_uid.values()
+
+        result = self._make_request("GET", "/v2/sync/groceries/")
+        groceries = result.get("result", [])
+        self._groceries_by_uid = {grocery.get("uid"): grocery for grocery in groceries}
+        self._groceries_revision = revision
+        return groceries
 
     def get_grocery_list(self, list_name: str) -> List[ListItem]:
         """
@@ -266,8 +321,7 @@ class PaprikaClient:
             if not list_uid:
                 logger.warning(f"Grocery list '{list_name}' not found, returning all items")
 
-            result = self._make_request("GET", "/v2/sync/groceries/")
-            groceries = result.get("result", [])
+            groceries = self._fetch_groceries()
 
             items = []
             for grocery in groceries:
@@ -315,8 +369,27 @@ class PaprikaClient:
         Returns:
             Paprika UID of created item
         """
+        return self.add_items([(name, checked)], list_name)[0]
+
+    def add_items(self, items: List[Tuple[str, bool]], list_name: str) -> List[str]:
+        """
+        Add several items to a grocery list in a single request
+
+        The groceries sync endpoint accepts an array, so any number of new
+        items costs one round-trip.
+
+        Args:
+            items: (name, checked) pairs to create
+            list_name: Name of the grocery list to add to
+
+        Returns:
+            Paprika UIDs of the created items, in the same order as items
+        """
+        if not items:
+            return []
+
         try:
-            logger.debug(f"Adding item to Paprika list '{list_name}': {name} (checked={checked})")
+            logger.debug(f"Adding {len(items)} items to Paprika list '{list_name}'")
 
             # Get the list UID
             list_uid = self.get_list_uid_by_name(list_name)
@@ -329,29 +402,28 @@ class PaprikaClient:
                     list_uid = default_list.get("uid")
                     logger.debug(f"Using default list: {default_list.get('name')}")
 
-            # Generate a UUID for the item
-            import uuid
-            uid = str(uuid.uuid4()).upper()
-
-            # Create grocery item - API requires gzip-compressed JSON array
-            grocery_item = {
-                "uid": uid,
-                "recipe_uid": None,
-                "name": name,
-                "order_flag": 0,
-                "purchased": checked,
-                "aisle": "",  # Will be auto-assigned by Paprika
-                "ingredient": name.lower(),  # Use name as ingredient
-                "recipe": None,
-                "instruction": "",
-                "quantity": "",
-                "separate": False,
-                "list_uid": list_uid,  # Specify which list to add to
-            }
+            # Create grocery items - API requires gzip-compressed JSON array
+            grocery_items = [
+                {
+                    "uid": str(uuid.uuid4()).upper(),
+                    "recipe_uid": None,
+                    "name": name,
+                    "order_flag": 0,
+                    "purchased": checked,
+                    "aisle": "",  # Will be auto-assigned by Paprika
+                    "ingredient": name.lower(),  # Use name as ingredient
+                    "recipe": None,
+                    "instruction": "",
+                    "quantity": "",
+                    "separate": False,
+                    "list_uid": list_uid,  # Specify which list to add to
+                }
+                for name, checked in items
+            ]
 
             # API expects an array, send as gzipped multipart form data
             result = self._make_request(
-                "POST", "/v2/sync/groceries/", data=[grocery_item], gzip_form_data=True
+                "POST", "/v2/sync/groceries/", data=grocery_items, gzip_form_data=True
             )
             logger.debug(f"Create response: {result}")
 
@@ -363,11 +435,15 @@ class PaprikaClient:
             if not result.get("result"):
                 raise Exception("Create operation did not return success")
 
-            logger.info(f"Added item to Paprika '{list_name}': {name} (uid={uid})")
-            return uid
+            uids = []
+            for grocery_item in grocery_items:
+                self._groceries_by_uid[grocery_item["uid"]] = grocery_item
+                uids.append(grocery_item["uid"])
+                logger.info(f"Added item to Paprika '{list_name}': {grocery_item['name']} (uid={grocery_item['uid']})")
+            return uids
 
         except Exception as e:
-            logger.error(f"Failed to add item to Paprika: {e}")
+            logger.error(f"Failed to add items to Paprika: {e}")
             raise
 
     def update_item(self, paprika_id: str, checked: bool, list_name: str, name: Optional[str] = None) -> None:
@@ -380,42 +456,64 @@ class PaprikaClient:
             list_name: Name of the grocery list containing the item
             name: Optional new name for the item
         """
+        if not self.update_items([(paprika_id, checked, name)], list_name):
+            raise Exception(f"Item {paprika_id} not found in grocery list")
+
+    def update_items(self, updates: List[Tuple[str, bool, Optional[str]]], list_name: str) -> List[str]:
+        """
+        Update several items (checked status or name) in a single request
+
+        Args:
+            updates: (paprika_id, checked, name) tuples; name may be None to keep it
+            list_name: Name of the grocery list containing the items
+
+        Returns:
+            Paprika IDs that were updated (items no longer in Paprika are skipped)
+        """
+        if not updates:
+            return []
+
         try:
-            logger.debug(f"Updating item in Paprika: {paprika_id} (checked={checked})")
+            logger.debug(f"Updating {len(updates)} items in Paprika list '{list_name}'")
 
-            # Get current item details first
-            items = self.get_grocery_list(list_name)
-            current_item = next((item for item in items if item.paprika_id == paprika_id), None)
+            # Records are posted whole, so refresh the snapshot if anything changed
+            # in Paprika since the last fetch rather than overwrite those edits
+            self._fetch_groceries()
 
-            if not current_item:
-                raise Exception(f"Item {paprika_id} not found in grocery list")
+            full_items = []
+            for paprika_id, checked, name in updates:
+                full_item = self._groceries_by_uid.get(paprika_id)
+                if not full_item:
+                    logger.warning(f"Item {paprika_id} not found in grocery list, skipping update")
+                    continue
 
-            # Get full item data from API
-            result = self._make_request("GET", "/v2/sync/groceries/")
-            full_items = result.get("result", [])
-            full_item = next((item for item in full_items if item["uid"] == paprika_id), None)
+                full_item = dict(full_item)
 
-            if not full_item:
-                raise Exception(f"Item {paprika_id} not found in full item list")
+                # Update fields
+                full_item["purchased"] = checked
+                if name:
+                    full_item["name"] = name
+                    full_item["ingredient"] = name.lower()
+                full_items.append(full_item)
 
-            # Update fields
-            full_item["purchased"] = checked
-            if name:
-                full_item["name"] = name
-                full_item["ingredient"] = name.lower()
+            if not full_items:
+                return []
 
             # Send as gzipped array
             result = self._make_request(
-                "POST", "/v2/sync/groceries/", data=[full_item], gzip_form_data=True
+                "POST", "/v2/sync/groceries/", data=full_items, gzip_form_data=True
             )
 
             if not result.get("result"):
                 raise Exception("Update operation did not return success")
 
-            logger.info(f"Updated item in Paprika: {paprika_id}")
+            for full_item in full_items:
+                self._groceries_by_uid[full_item["uid"]] = full_item
+                logger.info(f"Updated item in Paprika: {full_item['uid']}")
+            return [full_item["uid"] for full_item in full_items]
 
         except Exception as e:
-            logger.error(f"Failed to update item in Paprika: {e}")
+            logger.error(f"Failed to update items in Paprika: {e}")
             raise
 
     def remove_item(self, paprika_id: str) -> None:
@@ -435,6 +533,7 @@ class PaprikaClient:
             # Try DELETE endpoint first
             try:
                 self._make_request("DELETE", f"/v2/sync/groceries/{paprika_id}")
+                self._groceries_by_uid.pop(paprika_id, None)
                 logger.info(f"Removed item from Paprika: {paprika_id}")
                 return
             except requests.exceptions.HTTPError as e:
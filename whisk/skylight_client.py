@@ -4,9 +4,10 @@ import base64
 import json
 import logging
 import os
+import threading
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Set
 
 import requests
 
@@ -20,7 +21,8 @@ class SkylightClient:
 
     BASE_URL = "https://app.ourskylight.com/api"
 
-    def __init__(self, email: str, password: str, frame_id: str, token_cache_file: str = "skylight_token"):
+    def __init__(self, email: str, password: str, frame_id: str, token_cache_file: str = "skylight_token",
+                 session: Optional[requests.Session] = None):
         """
         Initialize Skylight client with credentials
 
@@ -29,6 +31,7 @@ class SkylightClient:
             password: Skylight account password
             frame_id: Skylight frame ID (e.g., "4878053")
             token_cache_file: Path to token cache file
+            session: Optional shared HTTP session (a new one is created if omitted)
         """
         self.email = email
         self.password = password
@@ -36,13 +39,21 @@ class SkylightClient:
         self.user_id: Optional[str] = None
         self.auth_token: Optional[str] = None
         self.token_cache_file = Path(token_cache_file)
-        self._session = requests.Session()
+        self._session = session or requests.Session()
+        # Serializes token loading and refresh across threads sharing this client
+        self._auth_lock = threading.Lock()
         self._user_data: Optional[Dict[str, Any]] = None
         self._frames_cache: Optional[List[Dict[str, Any]]] = None
         self._lists_cache: Optional[List[Dict[str, Any]]] = None
+        self._list_id_by_name: Dict[str, str] = {}
+        # Item IDs seen in each list on the last fetch, keyed by list name
+        self._list_item_ids: Dict[str, Set[str]] = {}
 
     def authenticate(self) -> None:
         """Authenticate with Skylight API using optimized approach with token caching"""
+        if self.user_id and self.auth_token:
+            return
+
         # Try loading cached token first
         if self._load_cached_token():
             logger.debug("Using cached Skylight token")
@@ -220,12 +231,16 @@ class SkylightClient:
         if self.user_id and self.auth_token:
             return
 
-        # Try loading cached token first
-        if self._load_cached_token():
-            return
+        with self._auth_lock:
+            if self.user_id and self.auth_token:
+                return
+
+            # Try loading cached token first
+            if self._load_cached_token():
+                return
 
-        # Authenticate from scratch
-        self.authenticate()
+            # Authenticate from scratch
+            self.authenticate()
 
     def _make_request(
         self,
@@ -252,6 +267,7 @@ class SkylightClient:
         url = f"{self.BASE_URL}{endpoint}"
 
         # Use discovered Basic Auth format: user_id:auth_token
+        credentials = (self.user_id, self.auth_token)
         auth_string = f"{self.user_id}:{self.auth_token}"
         auth_header = base64.b64encode(auth_string.encode()).decode()
 
@@ -278,16 +294,19 @@ class SkylightClient:
         except requests.exceptions.HTTPError as e:
             # Handle token expiration (401 Unauthorized)
             if e.response.status_code == 401:
-                logger.warning("Skylight token expired, re-authenticating...")
-                # Clear current auth data
-                self.user_id = None
-                self.auth_token = None
-                # Remove cached token
-                if self.token_cache_file.exists():
-                    self.token_cache_file.unlink()
-
-                # Re-authenticate and retry once
-                self.authenticate()
+                with self._auth_lock:
+                    # Concurrent requests can all get a 401; only the first one
+                    # to get here refreshes, the rest retry with its new token
+                    if (self.user_id, self.auth_token) == credentials:
+                        logger.warning("Skylight token expired, re-authenticating...")
+                        # Clear current auth data
+                        self.user_id = None
+                        self.auth_token = None
+                        # Remove cached token
+                        self.token_cache_file.unlink(missing_ok=True)
+
+                        # Re-authenticate and retry once
+                        self.authenticate()
 
                 # Update auth header with new token
                 auth_string = f"{self.user_id}:{self.auth_token}"
@@ -345,6 +364,10 @@ class SkylightClient:
                 # Handle JSON:API format - data is an array of list objects
                 lists_data = result.get("data", [])
                 self._lists_cache = lists_data
+                self._list_id_by_name = {}
+                for list_obj in lists_data:
+                    label = list_obj.get("attributes", {}).get("label")  # Note: uses "label" not "name"
+                    self._list_id_by_name.setdefault(label, list_obj.get("id"))
 
                 logger.info(f"Retrieved {len(self._lists_cache)} lists")
 
@@ -364,12 +387,8 @@ class SkylightClient:
         Returns:
             List ID or None if not found
         """
-        lists = self.get_lists()
-        for list_obj in lists:
-            attributes = list_obj.get("attributes", {})
-            if attributes.get("label") == list_name:  # Note: uses "label" not "name"
-                return list_obj.get("id")
-        return None
+        self.get_lists()
+        return self._list_id_by_name.get(list_name)
 
     def get_list_items(self, list_name: str) -> List[ListItem]:
         """
@@ -430,6 +449,7 @@ class SkylightClient:
                     )
                     items.append(item)
 
+            self._list_item_ids[list_name] = {item.skylight_id for item in items}
             logger.info(f"Retrieved {len(items)} items from '{list_name}'")
             return items
 
@@ -437,6 +457,20 @@ class SkylightClient:
             logger.error(f"Failed to get list items from Skylight: {e}")
             raise
 
+    def _get_list_item_ids(self, list_name: str) -> Set[str]:
+        """
+        Get IDs of items known to be in a list, fetching only if the list is not cached
+
+        Args:
+            list_name: Name of the list
+
+        Returns:
+            Set of Skylight item IDs in the list
+        """
+        if list_name not in self._list_item_ids:
+            self.get_list_items(list_name)
+        return self._list_item_ids[list_name]
+
     def add_item(self, name: str, list_name: str, checked: bool = False) -> str:
         """
         Add item to list (using discovered JSON:API structure)
@@ -501,6 +535,8 @@ class SkylightClient:
                     item_id = created_item.get("id")
 
                     if item_id:
+                        if list_name in self._list_item_ids:
+                            self._list_item_ids[list_name].add(str(item_id))
                         logger.info(f"Added item to Skylight '{list_name}': {name} (id={item_id})")
                         return str(item_id)
 
@@ -537,9 +573,7 @@ class SkylightClient:
                 raise Exception(f"List '{list_name}' not found")
 
             # Verify item exists in this specific list
-            items = self.get_list_items(list_name)
-            item_found = any(item.skylight_id == skylight_id for item in items)
-            if not item_found:
+            if skylight_id not in self._get_list_item_ids(list_name):
                 raise Exception(f"Item {skylight_id} not found in list '{list_name}'")
 
             # Prepare the request body with explicit status value
@@ -597,8 +631,7 @@ class SkylightClient:
                 raise Exception(f"List '{list_name}' not found")
 
             # Verify all items exist in this specific list (optional validation)
-            existing_items = self.get_list_items(list_name)
-            existing_ids = {item.skylight_id for item in existing_items}
+            existing_ids = self._get_list_item_ids(list_name)
 
             # Filter out items that don't exist (log warning but don't fail)
             valid_ids = []
@@ -617,6 +650,7 @@ class SkylightClient:
             payload = {"ids": valid_ids}
 
             self._make_request("DELETE", endpoint, payload)
+            existing_ids.difference_update(valid_ids)
             logger.info(f"Bulk removed {len(valid_ids)} items from Skylight list '{list_name}': {valid_ids}")
 
         except Exception as e:
@@ -9,7 +9,11 @@ This version implements the redesigned 3-table schema to handle:
 
 import logging
 import sqlite3
-from datetime import datetime, timezone, timedelta
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import List, Optional, Dict, Any, Tuple, NamedTuple
 from dataclasses import dataclass
@@ -18,6 +22,61 @@ from .models import ListItem
 
 logger = logging.getLogger(__name__)
 
+# RETURNING, generated columns and ALTER TABLE ... DROP COLUMN all need SQLite 3.35+
+MIN_SQLITE_VERSION = (3, 35, 0)
+
+# Default SQLITE_MAX_VARIABLE_NUMBER for SQLite builds before 3.32
+SQLITE_MAX_VARIABLES = 999
+
+# Buffered sync_log entries are written once this many accumulate
+SYNC_LOG_FLUSH_THRESHOLD = 500
+
+# sync_log entries older than this are pruned
+SYNC_LOG_RETENTION_DAYS = 7
+
+# Prepared statements kept per connection (sqlite3 default is 128)
+STATEMENT_CACHE_SIZE = 256
+
+# get_sync_statistics() results are reused this long while the database is unchanged
+STATS_CACHE_TTL_SECONDS = 5.0
+
+
+def _parse_datetime(dt_str) -> Optional[datetime]:
+    """Parse datetime string to datetime object"""
+    if not dt_str:
+        return None
+    try:
+        # Only API-sourced values use 'Z'; timestamps written here already carry +00:00
+        if dt_str[-1] == 'Z':
+            dt_str = dt_str[:-1] + '+00:00'
+        return datetime.fromisoformat(dt_str)
+    except (TypeError, ValueError):
+        return None
+
+
+class _LazyTimestamp:
+    """
+    Dataclass field that keeps the stored ISO string and parses it on first access
+
+    Rows read back from SQLite can be turned into items without paying for
+    datetime parsing on timestamps the caller never looks at.
+    """
+
+    def __set_name__(self, owner, name):
+        self._attr = f"_{name}"
+
+    def __get__(self, obj, objtype=None) -> Optional[datetime]:
+        if obj is None:
+            return None  # Field default seen by @dataclass
+        value = getattr(obj, self._attr)
+        if isinstance(value, str):
+            value = _parse_datetime(value)
+            setattr(obj, self._attr, value)
+        return value
+
+    def __set__(self, obj, value) -> None:
+        setattr(obj, self._attr, value)
+
 
 @dataclass
 class PaprikaItem:
@@ -30,12 +89,12 @@ class PaprikaItem:
     aisle: Optional[str] = None
     ingredient: Optional[str] = None
     # Synthetic timestamp management
-    created_at: Optional[datetime] = None
-    last_seen_at: Optional[datetime] = None
-    last_modified_at: Optional[datetime] = None
+    created_at: Optional[datetime] = _LazyTimestamp()
+    last_seen_at: Optional[datetime] = _LazyTimestamp()
+    last_modified_at: Optional[datetime] = _LazyTimestamp()
     # Sync state
     is_deleted: bool = False
-    last_synced_at: Optional[datetime] = None
+    last_synced_at: Optional[datetime] = _LazyTimestamp()
 
 
 @dataclass
@@ -47,10 +106,10 @@ class SkylightItem:
     name: str
     checked: bool
     # Real timestamps from API
-    skylight_created_at: Optional[datetime] = None
-    skylight_updated_at: Optional[datetime] = None
+    skylight_created_at: Optional[datetime] = _LazyTimestamp()
+    skylight_updated_at: Optional[datetime] = _LazyTimestamp()
     # Sync state
-    last_synced_at: Optional[datetime] = None
+    last_synced_at: Optional[datetime] = _LazyTimestamp()
 
 
 @dataclass
@@ -76,6 +135,247 @@ class SyncLogEntry:
     created_at: datetime
 
 
+# Column order expected by the row factories below
+PAPRIKA_ITEM_COLUMNS = (
+    "id, paprika_id, list_uid, name, checked, aisle, ingredient, "
+    "created_at, last_seen_at, last_modified_at, is_deleted, last_synced_at"
+)
+SKYLIGHT_ITEM_COLUMNS = (
+    "id, skylight_id, list_id, name, checked, "
+    "skylight_created_at, skylight_updated_at, last_synced_at"
+)
+
+
+# List ids and item names repeat across many rows, so the row factories intern
+# them: every row shares one string object per distinct value, and equal keys
+# compare by identity in the linker's name buckets
+
+def _paprika_row_factory(cursor: sqlite3.Cursor, row: tuple) -> PaprikaItem:
+    """Build a PaprikaItem from a row selected with PAPRIKA_ITEM_COLUMNS"""
+    (item_id, paprika_id, list_uid, name, checked, aisle, ingredient,
+     created_at, last_seen_at, last_modified_at, is_deleted, last_synced_at) = row
+    return PaprikaItem(
+        item_id, paprika_id, sys.intern(list_uid), sys.intern(name), bool(checked), aisle, ingredient,
+        created_at, last_seen_at, last_modified_at, bool(is_deleted), last_synced_at
+    )
+
+
+def _skylight_row_factory(cursor: sqlite3.Cursor, row: tuple) -> SkylightItem:
+    """Build a SkylightItem from a row selected with SKYLIGHT_ITEM_COLUMNS"""
+    (item_id, skylight_id, list_id, name, checked,
+     skylight_created_at, skylight_updated_at, last_synced_at) = row
+    return SkylightItem(
+        item_id, skylight_id, sys.intern(list_id), sys.intern(name), bool(checked),
+        skylight_created_at, skylight_updated_at, last_synced_at
+    )
+
+
+LINKED_ITEM_COLUMNS = (
+    "l.id, l.paprika_item_id, l.skylight_item_id, l.linked_at, l.confidence_score, "
+    "p.paprika_id, p.list_uid, p.name, p.checked, p.last_modified_at, p.is_deleted, "
+    "s.skylight_id, s.list_id, s.name, s.checked, s.skylight_updated_at"
+)
+
+
+def _item_link_row_factory(cursor: sqlite3.Cursor, row: tuple) -> ItemLink:
+    """Build an ItemLink without item details from an item_links row"""
+    link_id, paprika_item_id, skylight_item_id, linked_at, confidence_score = row
+    return ItemLink(
+        id=link_id,
+        paprika_item_id=paprika_item_id,
+        skylight_item_id=skylight_item_id,
+        linked_at=_parse_datetime(linked_at),
+        confidence_score=confidence_score
+    )
+
+
+def _linked_item_row_factory(cursor: sqlite3.Cursor, row: tuple) -> ItemLink:
+    """Build an ItemLink with both item summaries from a row selected with LINKED_ITEM_COLUMNS"""
+    (link_id, paprika_item_id, skylight_item_id, linked_at, confidence_score,
+     paprika_id, list_uid, p_name, p_checked, p_modified, p_deleted,
+     skylight_id, list_id, s_name, s_checked, s_updated) = row
+    return ItemLink(
+        id=link_id,
+        paprika_item_id=paprika_item_id,
+        skylight_item_id=skylight_item_id,
+        linked_at=_parse_datetime(linked_at),
+        confidence_score=confidence_score,
+        paprika_item=PaprikaItem(
+            id=paprika_item_id,
+            paprika_id=paprika_id,
+            list_uid=sys.intern(list_uid),
+            name=sys.intern(p_name),
+            checked=bool(p_checked),
+            last_modified_at=p_modified,
+            is_deleted=bool(p_deleted)
+        ),
+        skylight_item=SkylightItem(
+            id=skylight_item_id,
+            skylight_id=skylight_id,
+            list_id=sys.intern(list_id),
+            name=sys.intern(s_name),
+            checked=bool(s_checked),
+            skylight_updated_at=s_updated
+        )
+    )
+
+
+# Statements are defined once so every call site reuses the same prepared
+# statement from the connection cache
+_SQL_LAST_AUTOINCREMENT_ID = "SELECT seq FROM sqlite_sequence WHERE name = ?"
+_SQL_NEXT_SYNC_RUN_ID = "SELECT COALESCE(MAX(sync_run_id), 0) + 1 FROM paprika_items"
+
+# Multi-row writes: {values} is filled with one "(?, ...)" group per row in the chunk
+_SQL_UPSERT_PAPRIKA_ITEMS = f"""
+INSERT INTO paprika_items
+(paprika_id, list_uid, name, checked, aisle,
+ created_at, last_seen_at, last_modified_at, sync_run_id)
+VALUES {{values}}
+ON CONFLICT(paprika_id) DO UPDATE SET
+    name = excluded.name,
+    checked = excluded.checked,
+    aisle = excluded.aisle,
+    last_seen_at = CASE
+        WHEN name IS NOT excluded.name OR checked IS NOT excluded.checked OR aisle IS NOT excluded.aisle
+        THEN excluded.last_seen_at
+        ELSE last_seen_at
+    END,
+    last_modified_at = CASE
+        WHEN name IS NOT excluded.name OR checked IS NOT excluded.checked
+        THEN excluded.last_modified_at
+        ELSE last_modified_at
+    END,
+    sync_run_id = excluded.sync_run_id,
+    is_deleted = 0
+RETURNING {PAPRIKA_ITEM_COLUMNS}
+"""
+
+_SQL_SET_PAPRIKA_ITEM_CHECKED = """
+UPDATE paprika_items
+SET checked = ?
+WHERE paprika_id = ?
+"""
+
+_SQL_SET_SKYLIGHT_ITEM_CHECKED = """
+UPDATE skylight_items
+SET checked = ?
+WHERE skylight_id = ?
+"""
+
+_SQL_UPSERT_SKYLIGHT_ITEMS = f"""
+INSERT INTO skylight_items
+(skylight_id, list_id, name, checked, skylight_created_at, skylight_updated_at)
+VALUES {{values}}
+ON CONFLICT(skylight_id) DO UPDATE SET
+    name = excluded.name,
+    checked = excluded.checked,
+    skylight_created_at = excluded.skylight_created_at,
+    skylight_updated_at = excluded.skylight_updated_at
+WHERE name IS NOT excluded.name
+   OR checked IS NOT excluded.checked
+   OR skylight_updated_at IS NOT excluded.skylight_updated_at
+RETURNING {SKYLIGHT_ITEM_COLUMNS}
+"""
+
+_SQL_MARK_UNSEEN_PAPRIKA_DELETED = """
+UPDATE paprika_items
+SET is_deleted = 1
+WHERE is_deleted = 0 AND sync_run_id < ?
+"""
+
+_SQL_SELECT_UNLINKED_PAPRIKA = f"""
+SELECT {PAPRIKA_ITEM_COLUMNS} FROM paprika_items p
+WHERE p.is_deleted = 0
+  AND NOT EXISTS (SELECT 1 FROM item_links l WHERE l.paprika_item_id = p.id)
+"""
+
+_SQL_SELECT_UNLINKED_SKYLIGHT = f"""
+SELECT {SKYLIGHT_ITEM_COLUMNS} FROM skylight_items s
+WHERE NOT EXISTS (SELECT 1 FROM item_links l WHERE l.skylight_item_id = s.id)
+"""
+
+_SQL_INSERT_ITEM_LINK = """
+INSERT INTO item_links (paprika_item_id, skylight_item_id, linked_at, confidence_score)
+VALUES (?, ?, ?, ?)
+"""
+
+_SQL_INSERT_ITEM_LINKS = """
+INSERT INTO item_links (paprika_item_id, skylight_item_id, linked_at, confidence_score)
+VALUES {values}
+ON CONFLICT(paprika_item_id, skylight_item_id) DO NOTHING
+RETURNING id, paprika_item_id, skylight_item_id, linked_at, confidence_score
+"""
+
+_SQL_SELECT_LINKED_ITEMS_FOR_PAIR = f"""
+SELECT {LINKED_ITEM_COLUMNS}
+FROM item_links l
+JOIN paprika_items p ON l.paprika_item_id = p.id
+JOIN skylight_items s ON l.skylight_item_id = s.id
+WHERE p.list_uid = ? AND s.list_id = ? AND p.is_deleted = 0
+"""
+
+_SQL_SELECT_UNSEEN_LINKED_ITEMS_FOR_PAIR = _SQL_SELECT_LINKED_ITEMS_FOR_PAIR + "AND p.sync_run_id < ?\n"
+
+_SQL_SELECT_CHECKED_CONFLICTS = f"""
+SELECT {LINKED_ITEM_COLUMNS}
+FROM item_links l
+JOIN paprika_items p ON l.paprika_item_id = p.id
+JOIN skylight_items s ON l.skylight_item_id = s.id
+WHERE l.checked_conflict = 1 AND p.is_deleted = 0
+"""
+
+_SQL_INSERT_SYNC_LOG = """
+INSERT INTO sync_log (operation, paprika_item_id, skylight_item_id, details, created_at)
+VALUES (?, ?, ?, ?, ?)
+"""
+
+_SQL_COUNT_ITEMS = """
+SELECT COALESCE(SUM(CASE WHEN is_deleted = 0 THEN 1 ELSE 0 END), 0),
+       COALESCE(SUM(CASE WHEN is_deleted = 1 THEN 1 ELSE 0 END), 0),
+       (SELECT COUNT(*) FROM skylight_items),
+       (SELECT COUNT(*) FROM item_links)
+FROM paprika_items
+"""
+
+_SQL_PRUNE_SYNC_LOG = """
+DELETE FROM sync_log
+WHERE created_at < strftime('%Y-%m-%dT%H:%M:%S', 'now', ?)
+"""
+
+_SQL_COUNT_RECENT_OPERATIONS = """
+SELECT operation, COUNT(*) as count
+FROM sync_log
+WHERE created_at > strftime('%Y-%m-%dT%H:%M:%S', 'now', '-1 hour')
+GROUP BY operation
+"""
+
+_SQL_SAVE_PAPRIKA_MEAL = """
+INSERT OR REPLACE INTO paprika_meals (
+    paprika_id, meal_name, meal_date, meal_type, recipe_uid, notes,
+    paprika_timestamp, last_synced_at
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_SQL_SAVE_SKYLIGHT_MEAL = """
+INSERT OR REPLACE INTO skylight_meals (
+    skylight_id, meal_name, meal_date, meal_type, notes,
+    skylight_timestamp, last_synced_at
+) VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+_SQL_MARK_PAPRIKA_MEAL_DELETED = """
+UPDATE paprika_meals
+SET deleted_at = ?, last_synced_at = ?
+WHERE paprika_id = ?
+"""
+
+_SQL_MARK_SKYLIGHT_MEAL_DELETED = """
+UPDATE skylight_meals
+SET deleted_at = ?, last_synced_at = ?
+WHERE skylight_id = ?
+"""
+
+
 class StateManager:
     """Manages sync state using 3-table architecture with proper relationships"""
 
@@ -85,9 +385,25 @@ class StateManager:
 
         Args:
             db_path: Path to SQLite database file
+
+        Raises:
+            RuntimeError: If the SQLite library is older than MIN_SQLITE_VERSION
         """
+        if sqlite3.sqlite_version_info < MIN_SQLITE_VERSION:
+            raise RuntimeError(
+                f"Whisk requires SQLite {'.'.join(map(str, MIN_SQLITE_VERSION))} or newer, "
+                f"but Python is linked against SQLite {sqlite3.sqlite_version}"
+            )
+
         self.db_path = Path(db_path)
-        self.conn: Optional[sqlite3.Connection] = None
+        self.conn: Optional[sqlite3.Connection] = None  # Single writer connection
+        self._write_lock = threading.Lock()
+        self._local = threading.local()  # Per-thread read connection and write flag
+        self._read_conns: List[sqlite3.Connection] = []
+        self._read_conns_lock = threading.Lock()
+        self._log_buffer: List[Tuple] = []  # Pending sync_log rows
+        self._sync_run_id: Optional[int] = None  # Generation stamped on Paprika items this run
+        self._stats_cache: Optional[Tuple[Tuple[int, int, int], float, Dict[str, Any]]] = None
         self._initialize_database()
 
     def _initialize_database(self) -> None:
@@ -95,9 +411,12 @@ class StateManager:
         try:
             logger.info(f"Initializing StateManager database at {self.db_path}")
 
-            self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
-            self.conn.row_factory = sqlite3.Row  # Enable dict-like access
+            # Autocommit mode: transactions are opened explicitly via _transaction()
+            self.conn = sqlite3.connect(self.db_path, check_same_thread=False,
+                                        isolation_level=None,
+                                        cached_statements=STATEMENT_CACHE_SIZE)
             self.conn.execute("PRAGMA foreign_keys = ON")  # Enable foreign key constraints
+            self._configure_pragmas()
 
             # Create tables
             self._create_paprika_items_table()
@@ -110,13 +429,98 @@ class StateManager:
             self._create_skylight_meals_table()
             self._create_meal_links_table()
 
-            self.conn.commit()
+            self._analyze_if_needed()
             logger.info("StateManager database initialized successfully")
 
         except Exception as e:
             logger.error(f"Failed to initialize StateManager database: {e}")
             raise
 
+    @contextmanager
+    def _transaction(self):
+        """
+        Run the enclosed statements in a single explicit transaction on the writer
+
+        Holds the write lock for the duration, commits on success and rolls back
+        on error. Nested use joins the transaction that is already open instead
+        of starting a new one.
+        """
+        if getattr(self._local, 'writing', False):
+            yield
+            return
+
+        with self._write_lock:
+            self._local.writing = True
+            try:
+                with self.conn:
+                    self.conn.execute("BEGIN")
+                    yield
+            finally:
+                self._local.writing = False
+
+    def _reader(self) -> sqlite3.Connection:
+        """
+        Get this thread's read-only connection, opening it on first use
+
+        Under WAL, readers on their own connections never wait on the writer.
+        Falls back to the writer for in-memory databases, and while this thread
+        has a write transaction open so it sees its own uncommitted rows.
+        """
+        if str(self.db_path) == ':memory:' or getattr(self._local, 'writing', False):
+            return self.conn
+
+        conn = getattr(self._local, 'reader', None)
+        if conn is None:
+            conn = sqlite3.connect(f"{self.db_path.resolve().as_uri()}?mode=ro", uri=True,
+                                   check_same_thread=False, isolation_level=None,
+                                   cached_statements=STATEMENT_CACHE_SIZE)
+            conn.execute("PRAGMA busy_timeout = 5000")
+            self._local.reader = conn
+            with self._read_conns_lock:
+                self._read_conns.append(conn)
+        return conn
+
+    def _table_columns(self, table: str) -> Dict[str, int]:
+        """Map each column of table to its PRAGMA table_xinfo hidden flag (2/3 = generated)"""
+        return {name: hidden for _, name, _, _, _, _, hidden
+                in self.conn.execute(f"PRAGMA table_xinfo({table})")}
+
+    def _analyze_if_needed(self) -> None:
+        """Run ANALYZE once so the query planner has table statistics to work with"""
+        has_stats = self.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'sqlite_stat1'"
+        ).fetchone()
+        if not has_stats or not self.conn.execute("SELECT 1 FROM sqlite_stat1 LIMIT 1").fetchone():
+            self.conn.execute("ANALYZE")
+
+    def _optimize(self) -> None:
+        """Refresh planner statistics for tables that changed significantly since the last run"""
+        try:
+            with self._transaction():
+                self.conn.execute("PRAGMA optimize")
+        except sqlite3.Error as e:
+            logger.warning(f"PRAGMA optimize failed: {e}")
+
+    def _configure_pragmas(self) -> None:
+        """Use WAL with relaxed fsync so the many small commits stay cheap"""
+        # Only takes effect on a new, empty database; existing files keep their mode
+        self.conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+
+        # In-memory databases always use the 'memory' journal, so don't ask for WAL
+        if str(self.db_path) != ':memory:':
+            journal_mode = self.conn.execute("PRAGMA journal_mode = WAL").fetchone()[0]
+            if str(journal_mode).lower() != 'wal':
+                # e.g. filesystems without shared memory support
+                logger.warning(f"WAL journal mode unavailable, using '{journal_mode}' instead")
+
+        self.conn.executescript("""
+            PRAGMA synchronous = NORMAL;
+            PRAGMA temp_store = MEMORY;
+            PRAGMA cache_size = -65536;
+            PRAGMA mmap_size = 268435456;
+            PRAGMA busy_timeout = 5000;
+        """)
+
     def _create_paprika_items_table(self) -> None:
         """Create Paprika items table with synthetic timestamp management"""
         schema_sql = """
@@ -127,23 +531,58 @@ class StateManager:
             name TEXT NOT NULL,
             checked INTEGER DEFAULT 0,  -- purchased field from API
             aisle TEXT,
-            ingredient TEXT,
+            ingredient TEXT GENERATED ALWAYS AS (lower(name)) VIRTUAL,
             -- Synthetic timestamp management
             created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
             last_seen_at DATETIME DEFAULT CURRENT_TIMESTAMP,
             last_modified_at DATETIME DEFAULT CURRENT_TIMESTAMP,
             -- Sync state
             is_deleted INTEGER DEFAULT 0,
-            last_synced_at DATETIME
+            last_synced_at DATETIME,
+            sync_run_id INTEGER DEFAULT 0  -- Last sync run that saw this item
         );
+        """
+        self.conn.executescript(schema_sql)
+        self._migrate_paprika_ingredient_column()
+        self._migrate_paprika_sync_run_column()
+
+        index_sql = """
+        DROP INDEX IF EXISTS idx_paprika_active_lastseen;
 
         CREATE INDEX IF NOT EXISTS idx_paprika_id ON paprika_items(paprika_id);
         CREATE INDEX IF NOT EXISTS idx_paprika_list_uid ON paprika_items(list_uid);
         CREATE INDEX IF NOT EXISTS idx_paprika_name ON paprika_items(name);
         CREATE INDEX IF NOT EXISTS idx_paprika_deleted ON paprika_items(is_deleted);
         CREATE INDEX IF NOT EXISTS idx_paprika_last_modified ON paprika_items(last_modified_at);
+        CREATE INDEX IF NOT EXISTS idx_paprika_active ON paprika_items(id) WHERE is_deleted = 0;
+        CREATE INDEX IF NOT EXISTS idx_paprika_active_run
+            ON paprika_items(sync_run_id) WHERE is_deleted = 0;
+        CREATE INDEX IF NOT EXISTS idx_paprika_list_active
+            ON paprika_items(list_uid, sync_run_id) WHERE is_deleted = 0;
         """
-        self.conn.executescript(schema_sql)
+        self.conn.executescript(index_sql)
+
+    def _migrate_paprika_sync_run_column(self) -> None:
+        """Add paprika_items.sync_run_id to older databases"""
+        if 'sync_run_id' not in self._table_columns('paprika_items'):
+            logger.info("Migrating paprika_items: adding sync_run_id")
+            self.conn.execute("ALTER TABLE paprika_items ADD COLUMN sync_run_id INTEGER DEFAULT 0")
+
+    def _migrate_paprika_ingredient_column(self) -> None:
+        """
+        Replace the legacy stored paprika_items.ingredient with the generated column
+
+        Older databases wrote lower(name) into ingredient from Python.
+        """
+        if self._table_columns('paprika_items').get('ingredient') != 0:
+            return  # Already generated (hidden = 2)
+
+        logger.info("Migrating paprika_items.ingredient to a generated column")
+        with self._transaction():
+            self.conn.execute("ALTER TABLE paprika_items DROP COLUMN ingredient")
+            self.conn.execute(
+                "ALTER TABLE paprika_items ADD COLUMN ingredient TEXT GENERATED ALWAYS AS (lower(name)) VIRTUAL"
+            )
 
     def _create_skylight_items_table(self) -> None:
         """Create Skylight items table with real API timestamps"""
@@ -177,14 +616,72 @@ class StateManager:
             skylight_item_id INTEGER NOT NULL REFERENCES skylight_items(id) ON DELETE CASCADE,
             linked_at DATETIME DEFAULT CURRENT_TIMESTAMP,
             confidence_score REAL DEFAULT 1.0,  -- For fuzzy name matching
+            checked_conflict INTEGER DEFAULT 0,  -- Maintained by triggers below
             UNIQUE(paprika_item_id, skylight_item_id)
         );
+        """
+        self.conn.executescript(schema_sql)
+        self._migrate_item_links_conflict_column()
 
+        # checked_conflict mirrors (paprika.checked != skylight.checked) so the
+        # conflict query reads a partial index holding only conflicting links
+        index_sql = """
         CREATE INDEX IF NOT EXISTS idx_links_paprika ON item_links(paprika_item_id);
         CREATE INDEX IF NOT EXISTS idx_links_skylight ON item_links(skylight_item_id);
         CREATE INDEX IF NOT EXISTS idx_links_confidence ON item_links(confidence_score);
+        CREATE INDEX IF NOT EXISTS idx_links_conflict ON item_links(checked_conflict)
+            WHERE checked_conflict = 1;
+
+        CREATE TRIGGER IF NOT EXISTS trg_links_conflict_insert
+        AFTER INSERT ON item_links
+        BEGIN
+            UPDATE item_links
+            SET checked_conflict = (
+                (SELECT checked FROM paprika_items WHERE id = NEW.paprika_item_id) !=
+                (SELECT checked FROM skylight_items WHERE id = NEW.skylight_item_id)
+            )
+            WHERE id = NEW.id;
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS trg_paprika_checked_conflict
+        AFTER UPDATE OF checked ON paprika_items
+        WHEN OLD.checked IS NOT NEW.checked
+        BEGIN
+            UPDATE item_links
+            SET checked_conflict = (
+                NEW.checked != (SELECT checked FROM skylight_items WHERE id = item_links.skylight_item_id)
+            )
+            WHERE paprika_item_id = NEW.id;
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS trg_skylight_checked_conflict
+        AFTER UPDATE OF checked ON skylight_items
+        WHEN OLD.checked IS NOT NEW.checked
+        BEGIN
+            UPDATE item_links
+            SET checked_conflict = (
+                (SELECT checked FROM paprika_items WHERE id = item_links.paprika_item_id) != NEW.checked
+            )
+            WHERE skylight_item_id = NEW.id;
+        END;
         """
-        self.conn.executescript(schema_sql)
+        self.conn.executescript(index_sql)
+
+    def _migrate_item_links_conflict_column(self) -> None:
+        """Add item_links.checked_conflict to older databases and backfill it"""
+        if 'checked_conflict' in self._table_columns('item_links'):
+            return
+
+        logger.info("Migrating item_links: adding checked_conflict")
+        with self._transaction():
+            self.conn.execute("ALTER TABLE item_links ADD COLUMN checked_conflict INTEGER DEFAULT 0")
+            self.conn.execute("""
+                UPDATE item_links
+                SET checked_conflict = (
+                    (SELECT checked FROM paprika_items WHERE id = item_links.paprika_item_id) !=
+                    (SELECT checked FROM skylight_items WHERE id = item_links.skylight_item_id)
+                )
+            """)
 
     def _create_sync_log_table(self) -> None:
         """Create sync operations log for debugging"""
@@ -200,8 +697,10 @@ class StateManager:
 
         CREATE INDEX IF NOT EXISTS idx_sync_log_operation ON sync_log(operation);
         CREATE INDEX IF NOT EXISTS idx_sync_log_created ON sync_log(created_at);
-        CREATE INDEX IF NOT EXISTS idx_sync_log_paprika ON sync_log(paprika_item_id);
-        CREATE INDEX IF NOT EXISTS idx_sync_log_skylight ON sync_log(skylight_item_id);
+
+        -- Nothing looks log entries up by item, so don't pay for these on every write
+        DROP INDEX IF EXISTS idx_sync_log_paprika;
+        DROP INDEX IF EXISTS idx_sync_log_skylight;
         """
         self.conn.executescript(schema_sql)
 
@@ -219,15 +718,25 @@ class StateManager:
             -- Timestamps
             paprika_timestamp TEXT,  -- ISO 8601 format
             last_synced_at TEXT,     -- ISO 8601 format
-            deleted INTEGER DEFAULT 0 -- Track deletions
+            deleted_at TEXT          -- ISO 8601 format, NULL while active
         );
+        """
+        self.conn.executescript(schema_sql)
+        self._migrate_meal_deleted_column('paprika_meals')
+
+        # Partial indexes only cover active meals, which is all get_meals() reads
+        index_sql = """
+        DROP INDEX IF EXISTS idx_paprika_meals_deleted;
+        DROP INDEX IF EXISTS idx_paprika_meals_date;
+        DROP INDEX IF EXISTS idx_paprika_meals_type;
 
         CREATE INDEX IF NOT EXISTS idx_paprika_meals_id ON paprika_meals(paprika_id);
-        CREATE INDEX IF NOT EXISTS idx_paprika_meals_date ON paprika_meals(meal_date);
-        CREATE INDEX IF NOT EXISTS idx_paprika_meals_type ON paprika_meals(meal_type);
-        CREATE INDEX IF NOT EXISTS idx_paprika_meals_deleted ON paprika_meals(deleted);
+        CREATE INDEX IF NOT EXISTS idx_paprika_meals_active_date
+            ON paprika_meals(meal_date) WHERE deleted_at IS NULL;
+        CREATE INDEX IF NOT EXISTS idx_paprika_meals_active_type
+            ON paprika_meals(meal_type) WHERE deleted_at IS NULL;
         """
-        self.conn.executescript(schema_sql)
+        self.conn.executescript(index_sql)
 
     def _create_skylight_meals_table(self) -> None:
         """Create Skylight meals table"""
@@ -242,15 +751,49 @@ class StateManager:
             -- Timestamps
             skylight_timestamp TEXT, -- ISO 8601 format
             last_synced_at TEXT,     -- ISO 8601 format
-            deleted INTEGER DEFAULT 0 -- Track deletions
+            deleted_at TEXT          -- ISO 8601 format, NULL while active
         );
+        """
+        self.conn.executescript(schema_sql)
+        self._migrate_meal_deleted_column('skylight_meals')
+
+        index_sql = """
+        DROP INDEX IF EXISTS idx_skylight_meals_deleted;
+        DROP INDEX IF EXISTS idx_skylight_meals_date;
+        DROP INDEX IF EXISTS idx_skylight_meals_type;
 
         CREATE INDEX IF NOT EXISTS idx_skylight_meals_id ON skylight_meals(skylight_id);
-        CREATE INDEX IF NOT EXISTS idx_skylight_meals_date ON skylight_meals(meal_date);
-        CREATE INDEX IF NOT EXISTS idx_skylight_meals_type ON skylight_meals(meal_type);
-        CREATE INDEX IF NOT EXISTS idx_skylight_meals_deleted ON skylight_meals(deleted);
+        CREATE INDEX IF NOT EXISTS idx_skylight_meals_active_date
+            ON skylight_meals(meal_date) WHERE deleted_at IS NULL;
+        CREATE INDEX IF NOT EXISTS idx_skylight_meals_active_type
+            ON skylight_meals(meal_type) WHERE deleted_at IS NULL;
         """
-        self.conn.executescript(schema_sql)
+        self.conn.executescript(index_sql)
+
+    def _migrate_meal_deleted_column(self, table: str) -> None:
+        """
+        Migrate a meal table from the legacy `deleted` flag to `deleted_at`
+
+        Older databases tracked deletion with `deleted INTEGER DEFAULT 0`.
+        Rows flagged as deleted get their last sync time (or now) as deleted_at;
+        the legacy column is left in place but no longer read or written.
+
+        Args:
+            table: Meal table name ('paprika_meals' or 'skylight_meals')
+        """
+        columns = self._table_columns(table)
+        if 'deleted_at' in columns:
+            return
+
+        logger.info(f"Migrating {table}.deleted to {table}.deleted_at")
+        with self._transaction():
+            self.conn.execute(f"ALTER TABLE {table} ADD COLUMN deleted_at TEXT")
+            if 'deleted' in columns:
+                self.conn.execute(f"""
+                    UPDATE {table}
+                    SET deleted_at = COALESCE(last_synced_at, ?)
+                    WHERE deleted = 1
+                """, (datetime.now(timezone.utc).isoformat(),))
 
     def _create_meal_links_table(self) -> None:
         """Create foreign key relationships between meals"""
@@ -271,8 +814,14 @@ class StateManager:
         self.conn.executescript(schema_sql)
 
     def close(self) -> None:
-        """Close database connection"""
+        """Flush buffered sync log entries and close database connections"""
         if self.conn:
+            self.flush_sync_log()
+            with self._read_conns_lock:
+                for conn in self._read_conns:
+                    conn.close()
+                self._read_conns.clear()
+            self._local = threading.local()
             self.conn.close()
             self.conn = None
             logger.info("StateManager database connection closed")
@@ -295,91 +844,65 @@ class StateManager:
         Returns:
             PaprikaItem with synthetic timestamps
         """
-        try:
-            cursor = self.conn.cursor()
-            now = datetime.now(timezone.utc)
+        return self.upsert_paprika_items_bulk([item], list_uid)[0]
 
-            # Check if item already exists
-            cursor.execute("""
-                SELECT * FROM paprika_items WHERE paprika_id = ?
-            """, (item.paprika_id,))
-            existing = cursor.fetchone()
-
-            if existing:
-                # Update existing item - check if changed
-                changed = (
-                    existing['checked'] != item.checked or
-                    existing['name'] != item.name
-                )
+    def upsert_paprika_items_bulk(self, items: List[ListItem], list_uid: str) -> List[PaprikaItem]:
+        """
+        Insert or update many Paprika items in a single transaction
 
-                last_modified_at = now if changed else existing['last_modified_at']
-
-                cursor.execute("""
-                    UPDATE paprika_items
-                    SET name = ?, checked = ?, aisle = ?, ingredient = ?,
-                        last_seen_at = ?, last_modified_at = ?, is_deleted = 0
-                    WHERE paprika_id = ?
-                """, (
-                    item.name, item.checked, getattr(item, 'aisle', None),
-                    item.name.lower(), now, last_modified_at, item.paprika_id
-                ))
-
-                paprika_item = PaprikaItem(
-                    id=existing['id'],
-                    paprika_id=item.paprika_id,
-                    list_uid=list_uid,
-                    name=item.name,
-                    checked=item.checked,
-                    aisle=getattr(item, 'aisle', None),
-                    ingredient=item.name.lower(),
-                    created_at=self._parse_datetime(existing['created_at']),
-                    last_seen_at=now,
-                    last_modified_at=last_modified_at,
-                    is_deleted=False,
-                    last_synced_at=self._parse_datetime(existing['last_synced_at'])
-                )
+        Every row goes through one INSERT ... ON CONFLICT DO UPDATE ... RETURNING,
+        which stamps the current sync_run_id on all of them. last_modified_at only
+        moves when the name or checked state changed, last_seen_at when the aisle did too.
 
-                if changed:
-                    self.log_sync_operation('UPDATE', paprika_item_id=existing['id'],
-                                          details=f"Updated Paprika item: {item.name}")
-
-            else:
-                # Insert new item
-                cursor.execute("""
-                    INSERT INTO paprika_items
-                    (paprika_id, list_uid, name, checked, aisle, ingredient,
-                     created_at, last_seen_at, last_modified_at)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    item.paprika_id, list_uid, item.name, item.checked,
-                    getattr(item, 'aisle', None), item.name.lower(),
-                    now, now, now
-                ))
-
-                paprika_item = PaprikaItem(
-                    id=cursor.lastrowid,
-                    paprika_id=item.paprika_id,
-                    list_uid=list_uid,
-                    name=item.name,
-                    checked=item.checked,
-                    aisle=getattr(item, 'aisle', None),
-                    ingredient=item.name.lower(),
-                    created_at=now,
-                    last_seen_at=now,
-                    last_modified_at=now,
-                    is_deleted=False,
-                    last_synced_at=None
-                )
+        Args:
+            items: ListItems from Paprika API
+            list_uid: Paprika list UID
 
-                self.log_sync_operation('CREATE', paprika_item_id=paprika_item.id,
-                                      details=f"Created Paprika item: {item.name}")
+        Returns:
+            PaprikaItems with synthetic timestamps, in the same order as items
+        """
+        if not items:
+            return []
 
-            self.conn.commit()
-            return paprika_item
+        try:
+            now = datetime.now(timezone.utc)
+            stamp = now.isoformat()
+            # Later duplicates of the same paprika_id win, as with sequential upserts
+            unique_items = {item.paprika_id: item for item in items}
+            run_id = self._sync_run_id if self._sync_run_id is not None else self.start_sync_run()
+
+            rows = [
+                (paprika_id, list_uid, item.name, item.checked, getattr(item, 'aisle', None),
+                 stamp, stamp, stamp, run_id)
+                for paprika_id, item in unique_items.items()
+            ]
+
+            with self._transaction():
+                last_id = self._last_autoincrement_id('paprika_items')
+                # RETURNING hands back every stored row, so nothing needs re-reading
+                paprika_items = {
+                    written.paprika_id: written
+                    for written in self._execute_values_returning(_SQL_UPSERT_PAPRIKA_ITEMS, rows,
+                                                                  _paprika_row_factory)
+                }
+
+                log_rows = []
+                for paprika_id, written in paprika_items.items():
+                    # AUTOINCREMENT IDs are never reused, so anything above last_id is new
+                    if written.id > last_id:
+                        log_rows.append(('CREATE', written.id, None,
+                                         f"Created Paprika item: {written.name}", stamp))
+                    elif written.last_modified_at == now:
+                        log_rows.append(('UPDATE', written.id, None,
+                                         f"Updated Paprika item: {written.name}", stamp))
+
+                self._log_buffer.extend(log_rows)
+                self._write_sync_log_buffer()
+
+            return [paprika_items[item.paprika_id] for item in items]
 
         except Exception as e:
-            self.conn.rollback()
-            logger.error(f"Failed to upsert Paprika item: {e}")
+            logger.error(f"Failed to upsert Paprika items: {e}")
             raise
 
     def upsert_skylight_item(self, item: ListItem, list_id: str) -> SkylightItem:
@@ -393,123 +916,214 @@ class StateManager:
         Returns:
             SkylightItem with real timestamps
         """
-        try:
-            cursor = self.conn.cursor()
-
-            # Check if item already exists
-            cursor.execute("""
-                SELECT * FROM skylight_items WHERE skylight_id = ?
-            """, (item.skylight_id,))
-            existing = cursor.fetchone()
-
-            if existing:
-                # Update existing item
-                cursor.execute("""
-                    UPDATE skylight_items
-                    SET name = ?, checked = ?, skylight_created_at = ?,
-                        skylight_updated_at = ?
-                    WHERE skylight_id = ?
-                """, (
-                    item.name, item.checked, item.skylight_timestamp,
-                    item.skylight_timestamp, item.skylight_id
-                ))
-
-                skylight_item = SkylightItem(
-                    id=existing['id'],
-                    skylight_id=item.skylight_id,
-                    list_id=list_id,
-                    name=item.name,
-                    checked=item.checked,
-                    skylight_created_at=item.skylight_timestamp,
-                    skylight_updated_at=item.skylight_timestamp,
-                    last_synced_at=self._parse_datetime(existing['last_synced_at'])
-                )
+        return self.upsert_skylight_items_bulk([item], list_id)[0]
 
-                self.log_sync_operation('UPDATE', skylight_item_id=existing['id'],
-                                      details=f"Updated Skylight item: {item.name}")
-
-            else:
-                # Insert new item
-                cursor.execute("""
-                    INSERT INTO skylight_items
-                    (skylight_id, list_id, name, checked, skylight_created_at, skylight_updated_at)
-                    VALUES (?, ?, ?, ?, ?, ?)
-                """, (
-                    item.skylight_id, list_id, item.name, item.checked,
-                    item.skylight_timestamp, item.skylight_timestamp
-                ))
-
-                skylight_item = SkylightItem(
-                    id=cursor.lastrowid,
-                    skylight_id=item.skylight_id,
-                    list_id=list_id,
-                    name=item.name,
-                    checked=item.checked,
-                    skylight_created_at=item.skylight_timestamp,
-                    skylight_updated_at=item.skylight_timestamp,
-                    last_synced_at=None
-                )
+    def upsert_skylight_items_bulk(self, items: List[ListItem], list_id: str) -> List[SkylightItem]:
+        """
+        Insert or update many Skylight items in a single transaction
 
-                self.log_sync_operation('CREATE', skylight_item_id=skylight_item.id,
-                                      details=f"Created Skylight item: {item.name}")
+        Args:
+            items: ListItems from Skylight API
+            list_id: Skylight list ID
+
+        Returns:
+            SkylightItems with real timestamps, in the same order as items
+        """
+        if not items:
+            return []
 
-            self.conn.commit()
-            return skylight_item
+        try:
+            stamp = datetime.now(timezone.utc).isoformat()
+            unique_items = {item.skylight_id: item for item in items}
+
+            rows = []
+            for item in unique_items.values():
+                timestamp = item.skylight_timestamp.isoformat() if item.skylight_timestamp else None
+                rows.append((item.skylight_id, list_id, item.name, item.checked, timestamp, timestamp))
+
+            with self._transaction():
+                last_id = self._last_autoincrement_id('skylight_items')
+                # Unchanged rows are skipped by the upsert's WHERE and not returned
+                written_items = {
+                    written.skylight_id: written
+                    for written in self._execute_values_returning(_SQL_UPSERT_SKYLIGHT_ITEMS, rows,
+                                                                  _skylight_row_factory)
+                }
+
+                log_rows = []
+                for skylight_id, written in written_items.items():
+                    operation, verb = ('CREATE', 'Created') if written.id > last_id else ('UPDATE', 'Updated')
+                    log_rows.append((operation, None, written.id,
+                                     f"{verb} Skylight item: {written.name}", stamp))
+
+                self._log_buffer.extend(log_rows)
+                self._write_sync_log_buffer()
+
+                unchanged_keys = [key for key in unique_items if key not in written_items]
+                skylight_items = self._fetch_items_by_key('skylight_items', 'skylight_id', unchanged_keys,
+                                                          SKYLIGHT_ITEM_COLUMNS, _skylight_row_factory)
+                skylight_items.update(written_items)
+
+            return [skylight_items[item.skylight_id] for item in items]
 
         except Exception as e:
-            self.conn.rollback()
-            logger.error(f"Failed to upsert Skylight item: {e}")
+            logger.error(f"Failed to upsert Skylight items: {e}")
             raise
 
-    def mark_unseen_paprika_items_as_deleted(self, cutoff_time: datetime = None) -> int:
+    def _last_autoincrement_id(self, table: str) -> int:
+        """Get the highest ID ever allocated for an AUTOINCREMENT table"""
+        row = self.conn.execute(_SQL_LAST_AUTOINCREMENT_ID, (table,)).fetchone()
+        return row[0] if row else 0
+
+    def _execute_values_returning(self, sql: str, rows: List[Tuple], row_factory) -> List[Any]:
+        """
+        Run a multi-row VALUES ... RETURNING statement, chunked under SQLite's variable limit
+
+        Args:
+            sql: Statement with a {values} placeholder for the row groups
+            rows: Parameter tuples, one per VALUES row, all the same width
+            row_factory: Builds an item dataclass from each returned row
+
+        Returns:
+            Items built from the RETURNING rows
+        """
+        if not rows:
+            return []
+
+        width = len(rows[0])
+        group = f"({', '.join('?' * width)})"
+        chunk_size = SQLITE_MAX_VARIABLES // width
+
+        cursor = self.conn.cursor()
+        cursor.row_factory = row_factory
+        results = []
+        for start in range(0, len(rows), chunk_size):
+            chunk = rows[start:start + chunk_size]
+            params = [value for row in chunk for value in row]
+            cursor.execute(sql.format(values=', '.join([group] * len(chunk))), params)
+            results.extend(cursor)
+        return results
+
+    def _fetch_items_by_key(self, table: str, key_column: str, keys: List[str],
+                            columns: str, row_factory) -> Dict[str, Any]:
         """
-        Mark Paprika items not seen recently as potentially deleted
+        Fetch items whose key column is in keys, chunked to stay under SQLite's variable limit
 
         Args:
-            cutoff_time: Items not seen after this time are marked deleted
-                        (default: 1 minute ago)
+            table: Item table to read
+            key_column: Unique API ID column, also the attribute the items are keyed by
+            keys: API IDs to look up
+            columns: Column list matching row_factory
+            row_factory: Builds an item dataclass from each tuple row
+
+        Returns:
+            Dictionary of API ID to item for the keys that exist
+        """
+        items = {}
+        cursor = self.conn.cursor()
+        cursor.row_factory = row_factory
+        for start in range(0, len(keys), SQLITE_MAX_VARIABLES):
+            chunk = keys[start:start + SQLITE_MAX_VARIABLES]
+            placeholders = ', '.join('?' * len(chunk))
+            cursor.execute(f"SELECT {columns} FROM {table} WHERE {key_column} IN ({placeholders})", chunk)
+            for item in cursor:
+                items[getattr(item, key_column)] = item
+        return items
+
+    def start_sync_run(self) -> int:
+        """
+        Begin a new sync run generation for Paprika item liveness tracking
+
+        Upserts stamp items with the current run ID, which is what
+        mark_unseen_paprika_items_as_deleted compares against.
+
+        Returns:
+            The new sync run ID
+        """
+        self._sync_run_id = self._reader().execute(_SQL_NEXT_SYNC_RUN_ID).fetchone()[0]
+        logger.debug(f"Started sync run {self._sync_run_id}")
+        return self._sync_run_id
+
+    def end_sync_run(self) -> None:
+        """
+        Finish a sync run: persist buffered sync log entries and refresh planner statistics
+
+        PRAGMA optimize runs here once per run rather than after every write.
+        """
+        self.flush_sync_log()
+        self._optimize()
+
+    def mark_unseen_paprika_items_as_deleted(self, sync_run_id: Optional[int] = None) -> int:
+        """
+        Mark Paprika items not seen in a sync run as potentially deleted
+
+        Args:
+            sync_run_id: Items last stamped before this run are marked deleted
+                        (default: the current sync run)
         Returns:
             Number of items marked as deleted
         """
-        if cutoff_time is None:
-            cutoff_time = datetime.now(timezone.utc).replace(microsecond=0) - timedelta(minutes=1)
+        if sync_run_id is None:
+            sync_run_id = self._sync_run_id
+        if sync_run_id is None:
+            logger.debug("No sync run started; skipping unseen Paprika item check")
+            return 0
 
         try:
-            cursor = self.conn.cursor()
-            cursor.execute("""
-                UPDATE paprika_items
-                SET is_deleted = 1
-                WHERE last_seen_at < ? AND is_deleted = 0
-            """, (cutoff_time,))
+            with self._transaction():
+                cursor = self.conn.execute(_SQL_MARK_UNSEEN_PAPRIKA_DELETED, (sync_run_id,))
 
             deleted_count = cursor.rowcount
-            self.conn.commit()
 
             if deleted_count > 0:
-                logger.info(f"Marked {deleted_count} Paprika items as deleted (not seen since {cutoff_time})")
+                logger.info(f"Marked {deleted_count} Paprika items as deleted (not seen in sync run {sync_run_id})")
 
             return deleted_count
 
         except Exception as e:
-            self.conn.rollback()
             logger.error(f"Failed to mark unseen Paprika items: {e}")
             raise
 
+    def set_paprika_item_checked(self, paprika_id: str, checked: bool) -> None:
+        """
+        Record a Paprika item's checked state after changing it in Paprika
+
+        Args:
+            paprika_id: Paprika UID of the item
+            checked: New checked status
+        """
+        try:
+            with self._transaction():
+                self.conn.execute(_SQL_SET_PAPRIKA_ITEM_CHECKED, (checked, paprika_id))
+
+        except Exception as e:
+            logger.error(f"Failed to set Paprika item checked state: {e}")
+            raise
+
+    def set_skylight_item_checked(self, skylight_id: str, checked: bool) -> None:
+        """
+        Record a Skylight item's checked state after changing it in Skylight
+
+        Args:
+            skylight_id: Skylight ID of the item
+            checked: New checked status
+        """
+        try:
+            with self._transaction():
+                self.conn.execute(_SQL_SET_SKYLIGHT_ITEM_CHECKED, (checked, skylight_id))
+
+        except Exception as e:
+            logger.error(f"Failed to set Skylight item checked state: {e}")
+            raise
+
     def get_unlinked_paprika_items(self) -> List[PaprikaItem]:
         """Get Paprika items that are not linked to any Skylight items"""
         try:
-            cursor = self.conn.cursor()
-            cursor.execute("""
-                SELECT p.* FROM paprika_items p
-                LEFT JOIN item_links l ON p.id = l.paprika_item_id
-                WHERE l.paprika_item_id IS NULL AND p.is_deleted = 0
-            """)
+            cursor = self._reader().cursor()
+            cursor.row_factory = _paprika_row_factory
+            cursor.execute(_SQL_SELECT_UNLINKED_PAPRIKA)
 
-            items = []
-            for row in cursor.fetchall():
-                items.append(self._row_to_paprika_item(row))
-
-            return items
+            return list(cursor)
 
         except Exception as e:
             logger.error(f"Failed to get unlinked Paprika items: {e}")
@@ -518,18 +1132,11 @@ class StateManager:
     def get_unlinked_skylight_items(self) -> List[SkylightItem]:
         """Get Skylight items that are not linked to any Paprika items"""
         try:
-            cursor = self.conn.cursor()
-            cursor.execute("""
-                SELECT s.* FROM skylight_items s
-                LEFT JOIN item_links l ON s.id = l.skylight_item_id
-                WHERE l.skylight_item_id IS NULL
-            """)
-
-            items = []
-            for row in cursor.fetchall():
-                items.append(self._row_to_skylight_item(row))
+            cursor = self._reader().cursor()
+            cursor.row_factory = _skylight_row_factory
+            cursor.execute(_SQL_SELECT_UNLINKED_SKYLIGHT)
 
-            return items
+            return list(cursor)
 
         except Exception as e:
             logger.error(f"Failed to get unlinked Skylight items: {e}")
@@ -549,13 +1156,11 @@ class StateManager:
             Created ItemLink
         """
         try:
-            cursor = self.conn.cursor()
             now = datetime.now(timezone.utc)
 
-            cursor.execute("""
-                INSERT INTO item_links (paprika_item_id, skylight_item_id, linked_at, confidence_score)
-                VALUES (?, ?, ?, ?)
-            """, (paprika_item_id, skylight_item_id, now, confidence_score))
+            with self._transaction():
+                cursor = self.conn.execute(_SQL_INSERT_ITEM_LINK, (paprika_item_id, skylight_item_id,
+                                                                  now.isoformat(), confidence_score))
 
             link = ItemLink(
                 id=cursor.lastrowid,
@@ -565,8 +1170,6 @@ class StateManager:
                 confidence_score=confidence_score
             )
 
-            self.conn.commit()
-
             self.log_sync_operation('LINK', paprika_item_id=paprika_item_id,
                                   skylight_item_id=skylight_item_id,
                                   details=f"Linked items with confidence {confidence_score}")
@@ -574,10 +1177,46 @@ class StateManager:
             return link
 
         except Exception as e:
-            self.conn.rollback()
             logger.error(f"Failed to create item link: {e}")
             raise
 
+    def create_item_links_bulk(self, links: List[Tuple[int, int, float]]) -> List[ItemLink]:
+        """
+        Create many item links in a single transaction
+
+        Pairs that are already linked are skipped rather than raising.
+
+        Args:
+            links: (paprika_item_id, skylight_item_id, confidence_score) tuples
+
+        Returns:
+            ItemLinks that were created
+        """
+        if not links:
+            return []
+
+        try:
+            now = datetime.now(timezone.utc).isoformat()
+            rows = [(paprika_item_id, skylight_item_id, now, confidence_score)
+                    for paprika_item_id, skylight_item_id, confidence_score in links]
+
+            with self._transaction():
+                created = self._execute_values_returning(_SQL_INSERT_ITEM_LINKS, rows,
+                                                         _item_link_row_factory)
+
+                self._log_buffer.extend(
+                    ('LINK', link.paprika_item_id, link.skylight_item_id,
+                     f"Linked items with confidence {link.confidence_score}", now)
+                    for link in created
+                )
+                self._write_sync_log_buffer()
+
+            return created
+
+        except Exception as e:
+            logger.error(f"Failed to create item links: {e}")
+            raise
+
     def get_linked_items_for_pair(self, paprika_list_uid: str, skylight_list_id: str) -> List[ItemLink]:
         """
         Get all linked items for a specific list pair
@@ -590,105 +1229,58 @@ class StateManager:
             List of ItemLink objects with full item details
         """
         try:
-            cursor = self.conn.cursor()
-            cursor.execute("""
-                SELECT l.*,
-                       p.paprika_id, p.list_uid, p.name as p_name, p.checked as p_checked,
-                       p.last_modified_at as p_modified, p.is_deleted as p_deleted,
-                       s.skylight_id, s.list_id, s.name as s_name, s.checked as s_checked,
-                       s.skylight_updated_at as s_updated
-                FROM item_links l
-                JOIN paprika_items p ON l.paprika_item_id = p.id
-                JOIN skylight_items s ON l.skylight_item_id = s.id
-                WHERE p.list_uid = ? AND s.list_id = ? AND p.is_deleted = 0
-            """, (paprika_list_uid, skylight_list_id))
-
-            links = []
-            for row in cursor.fetchall():
-                link = ItemLink(
-                    id=row['id'],
-                    paprika_item_id=row['paprika_item_id'],
-                    skylight_item_id=row['skylight_item_id'],
-                    linked_at=self._parse_datetime(row['linked_at']),
-                    confidence_score=row['confidence_score']
-                )
+            cursor = self._reader().cursor()
+            cursor.row_factory = _linked_item_row_factory
+            cursor.execute(_SQL_SELECT_LINKED_ITEMS_FOR_PAIR, (paprika_list_uid, skylight_list_id))
 
-                # Attach item details
-                link.paprika_item = PaprikaItem(
-                    id=row['paprika_item_id'],
-                    paprika_id=row['paprika_id'],
-                    list_uid=row['list_uid'],
-                    name=row['p_name'],
-                    checked=bool(row['p_checked']),
-                    last_modified_at=self._parse_datetime(row['p_modified']),
-                    is_deleted=bool(row['p_deleted'])
-                )
+            return list(cursor)
 
-                link.skylight_item = SkylightItem(
-                    id=row['skylight_item_id'],
-                    skylight_id=row['skylight_id'],
-                    list_id=row['list_id'],
-                    name=row['s_name'],
-                    checked=bool(row['s_checked']),
-                    skylight_updated_at=self._parse_datetime(row['s_updated'])
-                )
+        except Exception as e:
+            logger.error(f"Failed to get linked items for pair: {e}")
+            raise
+
+    def get_unseen_linked_items_for_pair(self, paprika_list_uid: str, skylight_list_id: str,
+                                         sync_run_id: Optional[int] = None) -> List[ItemLink]:
+        """
+        Get linked items for a list pair whose Paprika item was not seen in a sync run
+
+        On a sync where nothing was removed from Paprika this returns no rows,
+        so deletion handling does not have to load every link for the pair.
 
-                links.append(link)
+        Args:
+            paprika_list_uid: Paprika list UID
+            skylight_list_id: Skylight list ID
+            sync_run_id: Run the Paprika items should have been stamped with
+                        (default: the current sync run)
+
+        Returns:
+            List of ItemLink objects with full item details
+        """
+        if sync_run_id is None:
+            sync_run_id = self._sync_run_id
+        if sync_run_id is None:
+            return self.get_linked_items_for_pair(paprika_list_uid, skylight_list_id)
 
-            return links
+        try:
+            cursor = self._reader().cursor()
+            cursor.row_factory = _linked_item_row_factory
+            cursor.execute(_SQL_SELECT_UNSEEN_LINKED_ITEMS_FOR_PAIR,
+                           (paprika_list_uid, skylight_list_id, sync_run_id))
+
+            return list(cursor)
 
         except Exception as e:
-            logger.error(f"Failed to get linked items for pair: {e}")
+            logger.error(f"Failed to get unseen linked items for pair: {e}")
             raise
 
     def get_linked_items_with_conflicts(self) -> List[ItemLink]:
         """Get linked items where Paprika and Skylight have different checked states"""
         try:
-            cursor = self.conn.cursor()
-            cursor.execute("""
-                SELECT l.*,
-                       p.name as p_name, p.checked as p_checked, p.last_modified_at as p_modified,
-                       p.paprika_id as p_paprika_id, p.list_uid as p_list_uid,
-                       s.name as s_name, s.checked as s_checked, s.skylight_updated_at as s_updated,
-                       s.skylight_id as s_skylight_id, s.list_id as s_list_id
-                FROM item_links l
-                JOIN paprika_items p ON l.paprika_item_id = p.id
-                JOIN skylight_items s ON l.skylight_item_id = s.id
-                WHERE p.checked != s.checked AND p.is_deleted = 0
-            """)
-
-            links = []
-            for row in cursor.fetchall():
-                link = ItemLink(
-                    id=row['id'],
-                    paprika_item_id=row['paprika_item_id'],
-                    skylight_item_id=row['skylight_item_id'],
-                    linked_at=self._parse_datetime(row['linked_at']),
-                    confidence_score=row['confidence_score']
-                )
-
-                # Attach item details for conflict resolution
-                link.paprika_item = PaprikaItem(
-                    id=row['paprika_item_id'],
-                    paprika_id=row['p_paprika_id'],  # Use actual paprika_id from DB
-                    list_uid=row['p_list_uid'],      # Use actual list_uid from DB
-                    name=row['p_name'],
-                    checked=bool(row['p_checked']),
-                    last_modified_at=self._parse_datetime(row['p_modified'])
-                )
+            cursor = self._reader().cursor()
+            cursor.row_factory = _linked_item_row_factory
+            cursor.execute(_SQL_SELECT_CHECKED_CONFLICTS)
 
-                link.skylight_item = SkylightItem(
-                    id=row['skylight_item_id'],
-                    skylight_id=row['s_skylight_id'], # Use actual skylight_id from DB
-                    list_id=row['s_list_id'],         # Use actual list_id from DB
-                    name=row['s_name'],
-                    checked=bool(row['s_checked']),
-                    skylight_updated_at=self._parse_datetime(row['s_updated'])
-                )
-
-                links.append(link)
-
-            return links
+            return list(cursor)
 
         except Exception as e:
             logger.error(f"Failed to get linked items with conflicts: {e}")
@@ -699,96 +1291,96 @@ class StateManager:
         """
         Log a sync operation for debugging and audit trail
 
+        Entries are buffered in memory and written by flush_sync_log(), which runs
+        at the end of bulk upserts, when the buffer fills up, and on close().
+
         Args:
             operation: Type of operation ('CREATE', 'UPDATE', 'DELETE', 'CONFLICT', 'LINK')
             paprika_item_id: Optional Paprika item ID
             skylight_item_id: Optional Skylight item ID
             details: Additional details about the operation
         """
-        try:
-            cursor = self.conn.cursor()
-            now = datetime.now(timezone.utc)
+        now = datetime.now(timezone.utc).isoformat()
+        self._log_buffer.append((operation, paprika_item_id, skylight_item_id, details, now))
+        logger.debug(f"Logged sync operation: {operation} - {details}")
 
-            cursor.execute("""
-                INSERT INTO sync_log (operation, paprika_item_id, skylight_item_id, details, created_at)
-                VALUES (?, ?, ?, ?, ?)
-            """, (operation, paprika_item_id, skylight_item_id, details, now))
+        if len(self._log_buffer) >= SYNC_LOG_FLUSH_THRESHOLD:
+            self.flush_sync_log()
 
-            self.conn.commit()
-            logger.debug(f"Logged sync operation: {operation} - {details}")
+    def flush_sync_log(self) -> None:
+        """Write all buffered sync log entries in a single transaction"""
+        if not self._log_buffer:
+            return
+
+        try:
+            with self._transaction():
+                self._write_sync_log_buffer()
 
         except Exception as e:
-            logger.error(f"Failed to log sync operation: {e}")
+            logger.error(f"Failed to flush sync log: {e}")
             # Don't raise - logging failures shouldn't break sync
 
-    # Utility methods
-    def _parse_datetime(self, dt_str) -> Optional[datetime]:
-        """Parse datetime string to datetime object"""
-        if not dt_str:
-            return None
-        try:
-            return datetime.fromisoformat(dt_str.replace('Z', '+00:00'))
-        except:
-            return None
-
-    def _row_to_paprika_item(self, row) -> PaprikaItem:
-        """Convert database row to PaprikaItem"""
-        return PaprikaItem(
-            id=row['id'],
-            paprika_id=row['paprika_id'],
-            list_uid=row['list_uid'],
-            name=row['name'],
-            checked=bool(row['checked']),
-            aisle=row['aisle'],
-            ingredient=row['ingredient'],
-            created_at=self._parse_datetime(row['created_at']),
-            last_seen_at=self._parse_datetime(row['last_seen_at']),
-            last_modified_at=self._parse_datetime(row['last_modified_at']),
-            is_deleted=bool(row['is_deleted']),
-            last_synced_at=self._parse_datetime(row['last_synced_at'])
-        )
+    def _write_sync_log_buffer(self) -> None:
+        """Insert buffered sync log entries without committing"""
+        entries, self._log_buffer = self._log_buffer, []
+        self.conn.executemany(_SQL_INSERT_SYNC_LOG, entries)
 
-    def _row_to_skylight_item(self, row) -> SkylightItem:
-        """Convert database row to SkylightItem"""
-        return SkylightItem(
-            id=row['id'],
-            skylight_id=row['skylight_id'],
-            list_id=row['list_id'],
-            name=row['name'],
-            checked=bool(row['checked']),
-            skylight_created_at=self._parse_datetime(row['skylight_created_at']),
-            skylight_updated_at=self._parse_datetime(row['skylight_updated_at']),
-            last_synced_at=self._parse_datetime(row['last_synced_at'])
-        )
+    def prune_sync_log(self, days: int = SYNC_LOG_RETENTION_DAYS) -> int:
+        """
+        Delete sync log entries older than the retention window
 
-    def get_sync_statistics(self) -> Dict[str, Any]:
-        """Get statistics about the sync state"""
+        Freed pages are handed back to the filesystem with an incremental vacuum
+        when the database was created with auto_vacuum = INCREMENTAL.
+
+        Args:
+            days: Number of days of sync log history to keep
+
+        Returns:
+            Number of entries deleted
+        """
         try:
-            cursor = self.conn.cursor()
+            with self._transaction():
+                cursor = self.conn.execute(_SQL_PRUNE_SYNC_LOG, (f"-{days} days",))
+            deleted_count = cursor.rowcount
 
-            # Get counts
-            cursor.execute("SELECT COUNT(*) FROM paprika_items WHERE is_deleted = 0")
-            paprika_count = cursor.fetchone()[0]
+            if deleted_count > 0:
+                logger.debug(f"Pruned {deleted_count} sync log entries older than {days} days")
+                # executescript steps the pragma to completion; execute() frees a single page
+                with self._write_lock:
+                    self.conn.executescript("PRAGMA incremental_vacuum(1000);")
 
-            cursor.execute("SELECT COUNT(*) FROM skylight_items")
-            skylight_count = cursor.fetchone()[0]
+            return deleted_count
 
-            cursor.execute("SELECT COUNT(*) FROM item_links")
-            linked_count = cursor.fetchone()[0]
+        except Exception as e:
+            logger.error(f"Failed to prune sync log: {e}")
+            return 0
 
-            cursor.execute("SELECT COUNT(*) FROM paprika_items WHERE is_deleted = 1")
-            deleted_count = cursor.fetchone()[0]
+    def get_sync_statistics(self) -> Dict[str, Any]:
+        """Get statistics about the sync state"""
+        try:
+            self.flush_sync_log()
+            reader = self._reader()
+
+            # data_version moves when another connection commits, total_changes
+            # when the writer does; reuse the last result while neither has.
+            # data_version is only comparable on the same connection, so the
+            # per-thread reader is part of the key
+            cache_key = (id(reader), reader.execute("PRAGMA data_version").fetchone()[0],
+                         self.conn.total_changes)
+            now = time.monotonic()
+            if self._stats_cache is not None:
+                cached_key, cached_at, cached_stats = self._stats_cache
+                if cached_key == cache_key and now - cached_at < STATS_CACHE_TTL_SECONDS:
+                    return {**cached_stats, 'recent_operations': dict(cached_stats['recent_operations'])}
+
+            # Get all counts in one pass over paprika_items
+            paprika_count, deleted_count, skylight_count, linked_count = \
+                reader.execute(_SQL_COUNT_ITEMS).fetchone()
 
             # Get recent sync activity
-            cursor.execute("""
-                SELECT operation, COUNT(*) as count
-                FROM sync_log
-                WHERE created_at > datetime('now', '-1 hour')
-                GROUP BY operation
-            """)
-            recent_ops = dict(cursor.fetchall())
+            recent_ops = dict(reader.execute(_SQL_COUNT_RECENT_OPERATIONS))
 
-            return {
+            stats = {
                 'paprika_items': paprika_count,
                 'skylight_items': skylight_count,
                 'linked_items': linked_count,
@@ -798,6 +1390,8 @@ class StateManager:
                 'recent_operations': recent_ops,
                 'database_path': str(self.db_path)
             }
+            self._stats_cache = (cache_key, now, stats)
+            return {**stats, 'recent_operations': dict(recent_ops)}
 
         except Exception as e:
             logger.error(f"Failed to get sync statistics: {e}")
@@ -816,49 +1410,36 @@ class StateManager:
             Database ID of saved meal
         """
         try:
-            cursor = self.conn.cursor()
             now = datetime.now(timezone.utc).isoformat()
 
-            if meal.exists_in_paprika:
-                # Save to paprika_meals table
-                cursor.execute("""
-                    INSERT OR REPLACE INTO paprika_meals (
-                        paprika_id, meal_name, meal_date, meal_type, recipe_uid, notes,
-                        paprika_timestamp, last_synced_at
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    meal.paprika_id,
-                    meal.name,
-                    meal.date.isoformat(),
-                    meal.meal_type,
-                    meal.recipe_uid,
-                    meal.notes,
-                    meal.paprika_timestamp.isoformat() if meal.paprika_timestamp else None,
-                    now
-                ))
-                meal_id = cursor.lastrowid
-                logger.debug(f"Saved Paprika meal: {meal.name} (id={meal_id})")
-
-            if meal.exists_in_skylight:
-                # Save to skylight_meals table
-                cursor.execute("""
-                    INSERT OR REPLACE INTO skylight_meals (
-                        skylight_id, meal_name, meal_date, meal_type, notes,
-                        skylight_timestamp, last_synced_at
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    meal.skylight_id,
-                    meal.name,
-                    meal.date.isoformat(),
-                    meal.meal_type,
-                    meal.notes,
-                    meal.skylight_timestamp.isoformat() if meal.skylight_timestamp else None,
-                    now
-                ))
-                meal_id = cursor.lastrowid
-                logger.debug(f"Saved Skylight meal: {meal.name} (id={meal_id})")
-
-            self.conn.commit()
+            with self._transaction():
+                if meal.exists_in_paprika:
+                    # Save to paprika_meals table
+                    meal_id = self.conn.execute(_SQL_SAVE_PAPRIKA_MEAL, (
+                        meal.paprika_id,
+                        meal.name,
+                        meal.date.isoformat(),
+                        meal.meal_type,
+                        meal.recipe_uid,
+                        meal.notes,
+                        meal.paprika_timestamp.isoformat() if meal.paprika_timestamp else None,
+                        now
+                    )).lastrowid
+                    logger.debug(f"Saved Paprika meal: {meal.name} (id={meal_id})")
+
+                if meal.exists_in_skylight:
+                    # Save to skylight_meals table
+                    meal_id = self.conn.execute(_SQL_SAVE_SKYLIGHT_MEAL, (
+                        meal.skylight_id,
+                        meal.name,
+                        meal.date.isoformat(),
+                        meal.meal_type,
+                        meal.notes,
+                        meal.skylight_timestamp.isoformat() if meal.skylight_timestamp else None,
+                        now
+                    )).lastrowid
+                    logger.debug(f"Saved Skylight meal: {meal.name} (id={meal_id})")
+
             return meal_id
 
         except Exception as e:
@@ -879,11 +1460,15 @@ class StateManager:
         try:
             from .models import MealItem
 
-            cursor = self.conn.cursor()
+            cursor = self._reader().cursor()
+            cursor.row_factory = sqlite3.Row  # Few rows; keep name access for readability
             meals = []
 
             # Build query with optional date filtering
-            where_clause = "WHERE p.deleted = 0 OR s.deleted = 0"
+            where_clause = """
+                WHERE ((p.id IS NOT NULL AND p.deleted_at IS NULL)
+                       OR (s.id IS NOT NULL AND s.deleted_at IS NULL))
+            """
             params = []
 
             if date_start:
@@ -957,26 +1542,16 @@ class StateManager:
             skylight_id: Skylight meal ID to mark as deleted
         """
         try:
-            cursor = self.conn.cursor()
             now = datetime.now(timezone.utc).isoformat()
 
-            if paprika_id:
-                cursor.execute("""
-                    UPDATE paprika_meals
-                    SET deleted = 1, last_synced_at = ?
-                    WHERE paprika_id = ?
-                """, (now, paprika_id))
-                logger.debug(f"Marked Paprika meal as deleted: {paprika_id}")
-
-            if skylight_id:
-                cursor.execute("""
-                    UPDATE skylight_meals
-                    SET deleted = 1, last_synced_at = ?
-                    WHERE skylight_id = ?
-                """, (now, skylight_id))
-                logger.debug(f"Marked Skylight meal as deleted: {skylight_id}")
-
-            self.conn.commit()
+            with self._transaction():
+                if paprika_id:
+                    self.conn.execute(_SQL_MARK_PAPRIKA_MEAL_DELETED, (now, now, paprika_id))
+                    logger.debug(f"Marked Paprika meal as deleted: {paprika_id}")
+
+                if skylight_id:
+                    self.conn.execute(_SQL_MARK_SKYLIGHT_MEAL_DELETED, (now, now, skylight_id))
+                    logger.debug(f"Marked Skylight meal as deleted: {skylight_id}")
 
         except Exception as e:
             logger.error(f"Failed to mark meal as deleted: {e}")